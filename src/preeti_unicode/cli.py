@@ -6,7 +6,9 @@ from Preeti font to Unicode.
 """
 
 import argparse
+import os
 import sys
+from concurrent.futures import ProcessPoolExecutor, as_completed
 from pathlib import Path
 from typing import List, Optional
 
@@ -15,6 +17,16 @@ from preeti_unicode.converter import convert_text
 from preeti_unicode.file_converter import file_converter
 
 
+# File extension to input format mapping used for auto-detection
+_EXT_TO_FORMAT = {
+    '.pdf': 'pdf',
+    '.docx': 'docx',
+    '.doc': 'docx',
+    '.txt': 'txt',
+    '.text': 'txt'
+}
+
+
 def convert_text_command(args) -> int:
     """Handle text conversion command."""
     try:
@@ -32,16 +44,8 @@ def convert_file_command(args) -> int:
         # Auto-detect input format if not specified
         input_format = args.input_format
         if input_format is None:
-            from pathlib import Path
-            input_path = Path(args.input)
-            extension = input_path.suffix.lower()
-            if extension == '.pdf':
-                input_format = 'pdf'
-            elif extension in ['.docx', '.doc']:
-                input_format = 'docx'
-            elif extension in ['.txt', '.text']:
-                input_format = 'txt'
-            else:
+            input_format = _EXT_TO_FORMAT.get(Path(args.input).suffix.lower())
+            if input_format is None:
                 print(f"Error: Cannot auto-detect format for file: {args.input}", file=sys.stderr)
                 return 1
 
@@ -68,8 +72,6 @@ def convert_file_command(args) -> int:
 def batch_convert_command(args) -> int:
     """Handle batch conversion command."""
     try:
-        from .file_converter import _file_converter
-        
         # Get list of input files
         input_files = []
         for pattern in args.input_files:
@@ -90,13 +92,32 @@ def batch_convert_command(args) -> int:
         
         print(f"Found {len(input_files)} files to convert")
         
-        results = _file_converter.batch_convert(
-            input_files=input_files,
-            input_format=args.input_format,
-            output_dir=args.output_dir,
-            output_format=args.output_format,
-            convert_numbers=args.convert_numbers
-        )
+        output_dir = Path(args.output_dir)
+        output_dir.mkdir(parents=True, exist_ok=True)
+        
+        # Files are independent, so convert them in parallel processes
+        results = {}
+        max_workers = min(len(input_files), os.cpu_count() or 1)
+        with ProcessPoolExecutor(max_workers=max_workers) as executor:
+            future_to_file = {
+                executor.submit(
+                    file_converter,
+                    input_file=input_file,
+                    input_format=args.input_format,
+                    output_file=output_dir / f"{input_file.stem}.{args.output_format}",
+                    output_format=args.output_format,
+                    convert_numbers=args.convert_numbers
+                ): input_file
+                for input_file in input_files
+            }
+            
+            for future in as_completed(future_to_file):
+                input_file = future_to_file[future]
+                try:
+                    results[str(input_file)] = future.result()
+                except Exception as e:
+                    print(f"Error converting {input_file}: {e}", file=sys.stderr)
+                    results[str(input_file)] = False
         
         successful = sum(1 for success in results.values() if success)
         total = len(results)
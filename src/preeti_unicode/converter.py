@@ -6,12 +6,64 @@ to proper Unicode Nepali text, including Nepali numeral conversion.
 """
 
 import re
+import threading
+from functools import lru_cache
 from typing import Dict, List, Optional
 
 
+# Common Preeti character combinations replaced before per-character handling
+_PRE_MAP = {
+    'qm': 's|', 'f]': 'ो', 'km': 'फ', '0f': 'ण',
+    'If': 'क्ष', 'if': 'ष', 'cf': 'आ'
+}
+
+# Single-pass equivalent of applying _PRE_MAP with chained str.replace calls.
+# 'f]' must win over the '?f' combinations, hence the negative lookaheads.
+_PRE_PATTERN = re.compile(r"qm|f\]|km|0f(?!\])|If(?!\])|if(?!\])|cf(?!\])")
+
+# Font name fragments indicating a Preeti-encoded font
+_PREETI_FONT_PATTERN = re.compile(r"preeti|pcs|nepali", re.IGNORECASE)
+
+# Reph and 'l' (ि) reordering rules, tried in priority order at each position:
+#   1. x + ('f' | 'ो') + '{'  ->  '{' + x + ('f' | 'ो')
+#   2. x + '{' (x != 'f')      ->  '{' + x
+#   3. 'l' is held back and emitted after the next plain character; any
+#      rule 1/2/'l' tokens in between are emitted first. A trailing 'l'
+#      with no following plain character is dropped.
+_NORM_PATTERN = re.compile(
+    r"(.)([fो])\{|([^f])\{|l((?:.[fो]\{|[^f]\{|l)*)(.?)",
+    re.DOTALL
+)
+
+# Tokens that may appear between an 'l' and the character it attaches to
+_NORM_RUN_PATTERN = re.compile(r"(.)([fो])\{|([^f])\{|l", re.DOTALL)
+
+
+def _normalize_match(match: "re.Match[str]") -> str:
+    """Replacement callback for _NORM_PATTERN and _NORM_RUN_PATTERN."""
+    if match.group(2) is not None:
+        return '{' + match.group(1) + match.group(2)
+    if match.group(3) is not None:
+        return '{' + match.group(3)
+    if match.re is _NORM_RUN_PATTERN:
+        # Repeated 'l' inside a pending run collapses into one
+        return ''
+
+    pending = match.group(4)
+    if pending:
+        pending = _NORM_RUN_PATTERN.sub(_normalize_match, pending)
+    following = match.group(5)
+    return pending + following + 'l' if following else pending
+
+
 class PreetiUnicodeConverter:
     """Core converter class for Preeti to Unicode conversion."""
     
+    __slots__ = (
+        'unicode_a_to_z', 'unicode_A_to_Z', 'unicode_0_to_9', 'symbols_dict',
+        'nepali_numerals', '_translate_table', '_num_table', '_fused_table'
+    )
+    
     def __init__(self):
         """Initialize the converter with mapping dictionaries."""
         self._setup_mappings()
@@ -54,6 +106,26 @@ class PreetiUnicodeConverter:
             "0": "०", "1": "१", "2": "२", "3": "३", "4": "४",
             "5": "५", "6": "६", "7": "७", "8": "८", "9": "९"
         }
+        
+        # Precomputed str.translate tables (codepoint -> replacement)
+        ascii_mapping: Dict[str, str] = {}
+        for first, base in (('a', self.unicode_a_to_z),
+                            ('A', self.unicode_A_to_Z),
+                            ('0', self.unicode_0_to_9)):
+            for index, replacement in enumerate(base):
+                ascii_mapping[chr(ord(first) + index)] = replacement
+        ascii_mapping.update(self.symbols_dict)
+        self._translate_table: Dict[int, str] = str.maketrans(ascii_mapping)
+        
+        self._num_table: Dict[int, str] = str.maketrans(self.nepali_numerals)
+        
+        # Composition of both tables so numeral conversion happens in the
+        # same pass as character mapping
+        self._fused_table: Dict[int, str] = dict(self._num_table)
+        self._fused_table.update({
+            key: value.translate(self._num_table)
+            for key, value in self._translate_table.items()
+        })
     
     def normalize_preeti(self, preeti_text: str) -> str:
         """
@@ -68,50 +140,21 @@ class PreetiUnicodeConverter:
         if not preeti_text:
             return ""
         
-        normalized = ''
-        previous_symbol = ''
-        
         # Handle common Preeti character combinations
-        text = preeti_text.replace('qm', 's|').replace('f]', 'ो').replace('km', 'फ')
-        text = text.replace('0f', 'ण').replace('If', 'क्ष').replace('if', 'ष').replace('cf', 'आ')
+        text = _PRE_PATTERN.sub(lambda match: _PRE_MAP[match.group(0)], preeti_text)
         
-        index = -1
-        while index + 1 < len(text):
-            index += 1
-            character = text[index]
-            
-            try:
-                # Handle special combinations with '{'
-                if index + 2 < len(text) and text[index + 2] == '{':
-                    if text[index + 1] == 'f' or text[index + 1] == 'ो':
-                        normalized += '{' + character + text[index + 1]
-                        index += 2
-                        continue
-                
-                if index + 1 < len(text) and text[index + 1] == '{':
-                    if character != 'f':
-                        normalized += '{' + character
-                        index += 1
-                        continue
-            except IndexError:
-                pass
-            
-            # Handle 'l' character special case
-            if character == 'l':
-                previous_symbol = 'l'
-                continue
-            else:
-                normalized += character + previous_symbol
-                previous_symbol = ''
-        
-        return normalized
+        # Move '{' (reph) before the preceding character(s) and 'l' (ि) after
+        # the character that follows it
+        return _NORM_PATTERN.sub(_normalize_match, text)
     
-    def convert_to_unicode(self, preeti_text: str) -> str:
+    def convert_to_unicode(self, preeti_text: str, convert_numbers: bool = False) -> str:
         """
         Convert Preeti text to Unicode.
         
         Args:
             preeti_text: Preeti text to convert
+            convert_numbers: Whether to also convert English numerals to
+                Nepali numerals in the same pass
             
         Returns:
             Converted Unicode text
@@ -119,31 +162,14 @@ class PreetiUnicodeConverter:
         if not preeti_text:
             return ""
         
-        converted = ''
-        normalized_preeti = self.normalize_preeti(preeti_text)
+        table = self._fused_table if convert_numbers else self._translate_table
         
-        for character in normalized_preeti:
-            try:
-                char_code = ord(character)
-                
-                # Handle lowercase letters (a-z)
-                if 97 <= char_code <= 122:  # a-z
-                    converted += self.unicode_a_to_z[char_code - 97]
-                # Handle uppercase letters (A-Z)
-                elif 65 <= char_code <= 90:  # A-Z
-                    converted += self.unicode_A_to_Z[char_code - 65]
-                # Handle numbers (0-9)
-                elif 48 <= char_code <= 57:  # 0-9
-                    converted += self.unicode_0_to_9[char_code - 48]
-                # Handle special symbols
-                else:
-                    converted += self.symbols_dict.get(character, character)
-                    
-            except (KeyError, IndexError):
-                # If character not found in mappings, keep original
-                converted += character
-        
-        return converted
+        # Digit-only text (page numbers, table cells) has nothing to normalize
+        if preeti_text.isdigit() and preeti_text.isascii():
+            return preeti_text.translate(table)
+        
+        normalized_preeti = self.normalize_preeti(preeti_text)
+        return normalized_preeti.translate(table)
     
     def convert_numbers_to_nepali(self, text: str) -> str:
         """
@@ -158,15 +184,31 @@ class PreetiUnicodeConverter:
         if not text:
             return ""
         
-        result = ""
-        for char in text:
-            result += self.nepali_numerals.get(char, char)
-        
-        return result
+        return text.translate(self._num_table)
+
+
+# Per-thread converter instances, so threaded batch conversion does not
+# share one object's tables across cores
+_thread_local = threading.local()
 
 
-# Global converter instance
-_converter = PreetiUnicodeConverter()
+def _get_converter() -> PreetiUnicodeConverter:
+    """Get the converter instance for the calling thread."""
+    converter = getattr(_thread_local, 'converter', None)
+    if converter is None:
+        converter = _thread_local.converter = PreetiUnicodeConverter()
+    return converter
+
+
+# Texts up to this length are memoized; longer texts (whole pages or
+# documents) rarely repeat and would only bloat the cache
+_CACHE_MAX_TEXT_LENGTH = 256
+
+
+@lru_cache(maxsize=4096)
+def _convert_text_cached(text: str, convert_numbers: bool) -> str:
+    """Memoized conversion for short, frequently repeated texts."""
+    return _get_converter().convert_to_unicode(text, convert_numbers=convert_numbers)
 
 
 def convert_text(text: str, convert_numbers: bool = True) -> str:
@@ -190,14 +232,11 @@ def convert_text(text: str, convert_numbers: bool = True) -> str:
     if not text:
         return ""
     
-    # Convert Preeti to Unicode
-    unicode_text = _converter.convert_to_unicode(text)
-    
-    # Convert numbers if requested
-    if convert_numbers:
-        unicode_text = _converter.convert_numbers_to_nepali(unicode_text)
+    if len(text) <= _CACHE_MAX_TEXT_LENGTH:
+        return _convert_text_cached(text, convert_numbers)
     
-    return unicode_text
+    # Convert Preeti to Unicode, converting numbers in the same pass if requested
+    return _get_converter().convert_to_unicode(text, convert_numbers=convert_numbers)
 
 
 def is_preeti_font(font_name: Optional[str]) -> bool:
@@ -213,7 +252,4 @@ def is_preeti_font(font_name: Optional[str]) -> bool:
     if not font_name:
         return False
     
-    font_name = font_name.lower()
-    preeti_indicators = ['preeti', 'pcs', 'nepali']
-    
-    return any(indicator in font_name for indicator in preeti_indicators)
+    return _PREETI_FONT_PATTERN.search(font_name) is not None
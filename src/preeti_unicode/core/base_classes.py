@@ -6,9 +6,16 @@ and provide default implementations for interface methods.
 """
 
 from abc import ABC, abstractmethod
-from typing import Any, Dict, List, Optional, Union, Generic, TypeVar
+from typing import (
+    Any, Dict, FrozenSet, List, Mapping, Optional, Sequence, Tuple, Union, Generic,
+    TypeVar
+)
 from pathlib import Path
+from types import MappingProxyType
 import logging
+import os
+import stat
+import sys
 import time
 from concurrent.futures import ThreadPoolExecutor, as_completed
 
@@ -23,6 +30,68 @@ from preeti_unicode.core.exceptions import (
 
 T = TypeVar('T')
 
+# Loggers resolved by name, so constructing components does not go through
+# logging.getLogger (and its module-level lock) every time
+_LOGGERS: Dict[str, logging.Logger] = {}
+
+
+def _get_logger(name: str) -> logging.Logger:
+    """
+    Get a logger by name, caching the lookup.
+    
+    Args:
+        name: Logger name
+        
+    Returns:
+        Logger instance
+    """
+    logger = _LOGGERS.get(name)
+    if logger is None:
+        logger = _LOGGERS.setdefault(name, logging.getLogger(name))
+    return logger
+
+
+# Interned extension tuples and lowercase lookup sets, shared by every
+# reader declaring the same extensions
+_EXTENSION_SETS: Dict[Tuple[str, ...], Tuple[Tuple[str, ...], FrozenSet[str]]] = {}
+
+
+def _shared_extensions(extensions: Sequence[str]) -> Tuple[Tuple[str, ...], FrozenSet[str]]:
+    """
+    Get the shared extension tuple and lowercase lookup set.
+    
+    Args:
+        extensions: Supported file extensions
+        
+    Returns:
+        Tuple of (interned extensions, frozenset of interned lowercase extensions)
+    """
+    key = tuple(extensions)
+    shared = _EXTENSION_SETS.get(key)
+    if shared is None:
+        shared = _EXTENSION_SETS.setdefault(key, (
+            tuple(sys.intern(ext) for ext in key),
+            frozenset(sys.intern(ext.lower()) for ext in key)
+        ))
+    return shared
+
+
+def _lower_suffix(file_path: Path) -> str:
+    """
+    Get the lowercase final suffix of a path, matching ``Path.suffix``.
+    
+    Args:
+        file_path: Path to inspect
+        
+    Returns:
+        Lowercase suffix including the dot, or an empty string
+    """
+    name = file_path.name
+    dot = name.rfind('.')
+    if 0 < dot < len(name) - 1:
+        return name[dot:].lower()
+    return ''
+
 
 class BaseConverter(IConverter[T], ABC):
     """
@@ -39,8 +108,17 @@ class BaseConverter(IConverter[T], ABC):
         Args:
             logger: Optional logger instance
         """
-        self.logger = logger or logging.getLogger(self.__class__.__name__)
-        self._supported_formats: List[str] = []
+        self.logger = logger or _get_logger(self.__class__.__name__)
+        self._supported_formats = []
+    
+    @property
+    def _supported_formats(self) -> Tuple[str, ...]:
+        """Supported formats, kept as a tuple so it can be shared without copying."""
+        return self._supported_formats_tuple
+    
+    @_supported_formats.setter
+    def _supported_formats(self, formats: Sequence[str]) -> None:
+        self._supported_formats_tuple = tuple(sys.intern(fmt) for fmt in formats)
     
     def convert(self, text: str, **kwargs) -> str:
         """
@@ -57,35 +135,95 @@ class BaseConverter(IConverter[T], ABC):
             ConversionError: If conversion fails
             ValidationError: If input validation fails
         """
+        # Validate input
+        if not self.validate_input(text):
+            raise ValidationError(
+                "Input text validation failed",
+                field_name="text"
+            )
+        
+        # Perform conversion, timing it only when debug logging is enabled
+        debug = self.logger.isEnabledFor(logging.DEBUG)
+        if debug:
+            self.logger.debug("Converting text of length %d", len(text))
+            start_time = time.perf_counter()
+        
         try:
-            # Validate input
-            if not self.validate_input(text):
-                raise ValidationError(
-                    "Input text validation failed",
-                    field_name="text"
-                )
-            
-            # Perform conversion
-            self.logger.debug(f"Converting text of length {len(text)}")
-            start_time = time.time()
-            
             result = self._convert_impl(text, **kwargs)
+        except ValidationError:
+            raise
+        except Exception as e:
+            raise self._conversion_error(text, e)
+        
+        if debug:
+            elapsed_time = time.perf_counter() - start_time
+            self.logger.debug("Conversion completed in %.3f seconds", elapsed_time)
+        
+        return result
+    
+    def convert_batch(self, texts: List[str], **kwargs) -> List[str]:
+        """
+        Convert several texts, validating all of them up front.
+        
+        Args:
+            texts: Input texts to convert
+            **kwargs: Additional conversion options
             
-            elapsed_time = time.time() - start_time
-            self.logger.debug(f"Conversion completed in {elapsed_time:.3f} seconds")
-            
-            return result
+        Returns:
+            Converted texts, in input order
             
+        Raises:
+            ConversionError: If converting any text fails
+            ValidationError: If any input fails validation
+        """
+        validate = self.validate_input
+        for text in texts:
+            if not validate(text):
+                raise ValidationError(
+                    "Input text validation failed",
+                    field_name="texts"
+                )
+        
+        debug = self.logger.isEnabledFor(logging.DEBUG)
+        if debug:
+            self.logger.debug("Converting batch of %d texts", len(texts))
+            start_time = time.perf_counter()
+        
+        convert_impl = self._convert_impl
+        results = []
+        text = None
+        try:
+            for text in texts:
+                results.append(convert_impl(text, **kwargs))
         except ValidationError:
             raise
         except Exception as e:
-            self.logger.error(f"Conversion failed: {e}")
-            raise ConversionError(
-                f"Failed to convert text: {str(e)}",
-                input_text=text,
-                conversion_type=self.__class__.__name__,
-                cause=e
-            )
+            raise self._conversion_error(text, e)
+        
+        if debug:
+            elapsed_time = time.perf_counter() - start_time
+            self.logger.debug("Batch conversion completed in %.3f seconds", elapsed_time)
+        
+        return results
+    
+    def _conversion_error(self, text: Optional[str], error: Exception) -> ConversionError:
+        """
+        Log a failed conversion and wrap the error.
+        
+        Args:
+            text: Input text that failed to convert
+            error: Exception raised by the conversion
+            
+        Returns:
+            ConversionError to raise
+        """
+        self.logger.error("Conversion failed: %s", error)
+        return ConversionError(
+            f"Failed to convert text: {str(error)}",
+            input_text=text,
+            conversion_type=self.__class__.__name__,
+            cause=error
+        )
     
     @abstractmethod
     def _convert_impl(self, text: str, **kwargs) -> str:
@@ -113,14 +251,14 @@ class BaseConverter(IConverter[T], ABC):
         """
         return text is not None and isinstance(text, str)
     
-    def get_supported_formats(self) -> List[str]:
+    def get_supported_formats(self) -> Tuple[str, ...]:
         """
-        Get list of supported input formats.
+        Get supported input formats.
         
         Returns:
-            List of supported format names
+            Tuple of supported format names
         """
-        return self._supported_formats.copy()
+        return self._supported_formats
 
 
 class BaseReader(IReader[T], ABC):
@@ -138,8 +276,19 @@ class BaseReader(IReader[T], ABC):
         Args:
             logger: Optional logger instance
         """
-        self.logger = logger or logging.getLogger(self.__class__.__name__)
-        self._supported_extensions: List[str] = []
+        self.logger = logger or _get_logger(self.__class__.__name__)
+        self._supported_extensions = []
+    
+    @property
+    def _supported_extensions(self) -> Tuple[str, ...]:
+        """Supported extensions, kept as a tuple so it can be shared without copying."""
+        return self._supported_extensions_tuple
+    
+    @_supported_extensions.setter
+    def _supported_extensions(self, extensions: Sequence[str]) -> None:
+        self._supported_extensions_tuple, self._supported_extensions_set = (
+            _shared_extensions(extensions)
+        )
     
     def read(self, file_path: Path, **kwargs) -> Dict[str, Any]:
         """
@@ -157,26 +306,37 @@ class BaseReader(IReader[T], ABC):
             ValidationError: If file validation fails
         """
         try:
-            # Validate file
-            if not self.validate_file(file_path):
+            # Stat the file once and reuse the result for validation and metadata
+            try:
+                file_stat: Optional[os.stat_result] = os.stat(file_path)
+            except OSError:
+                file_stat = None
+            
+            # Validate file (honouring validate_file overrides in subclasses)
+            if type(self).validate_file is BaseReader.validate_file:
+                is_valid = self._validate_file_stat(file_path, file_stat)
+            else:
+                is_valid = self.validate_file(file_path)
+            
+            if not is_valid:
                 raise ValidationError(
                     f"File validation failed: {file_path}",
                     field_name="file_path"
                 )
             
             # Read file
-            self.logger.debug(f"Reading file: {file_path}")
-            start_time = time.time()
+            self.logger.debug("Reading file: %s", file_path)
+            start_time = time.perf_counter()
             
             result = self._read_impl(file_path, **kwargs)
             
-            elapsed_time = time.time() - start_time
-            self.logger.debug(f"File read completed in {elapsed_time:.3f} seconds")
+            elapsed_time = time.perf_counter() - start_time
+            self.logger.debug("File read completed in %.3f seconds", elapsed_time)
             
             # Add metadata
             result.setdefault('metadata', {}).update({
                 'file_path': str(file_path),
-                'file_size': file_path.stat().st_size if file_path.exists() else 0,
+                'file_size': file_stat.st_size if file_stat is not None else 0,
                 'read_time': elapsed_time,
                 'reader_type': self.__class__.__name__
             })
@@ -186,7 +346,7 @@ class BaseReader(IReader[T], ABC):
         except ValidationError:
             raise
         except Exception as e:
-            self.logger.error(f"Failed to read file {file_path}: {e}")
+            self.logger.error("Failed to read file %s: %s", file_path, e)
             raise FileProcessingError(
                 f"Failed to read file: {str(e)}",
                 file_path=file_path,
@@ -218,26 +378,41 @@ class BaseReader(IReader[T], ABC):
         Returns:
             True if file is valid and readable, False otherwise
         """
-        if not file_path.exists():
+        try:
+            file_stat = os.stat(file_path)
+        except OSError:
             return False
         
-        if not file_path.is_file():
+        return self._validate_file_stat(file_path, file_stat)
+    
+    def _validate_file_stat(self, file_path: Path, file_stat: Optional[os.stat_result]) -> bool:
+        """
+        Validate a file using an already obtained stat result.
+        
+        Args:
+            file_path: Path to the file to validate
+            file_stat: Result of os.stat for the file, or None if it failed
+            
+        Returns:
+            True if file is valid and readable, False otherwise
+        """
+        if file_stat is None or not stat.S_ISREG(file_stat.st_mode):
             return False
         
         # Check file extension
-        if self._supported_extensions:
-            return file_path.suffix.lower() in self._supported_extensions
+        if self._supported_extensions_set:
+            return _lower_suffix(file_path) in self._supported_extensions_set
         
         return True
     
-    def get_supported_extensions(self) -> List[str]:
+    def get_supported_extensions(self) -> Tuple[str, ...]:
         """
-        Get list of supported file extensions.
+        Get supported file extensions.
         
         Returns:
-            List of supported file extensions (including the dot)
+            Tuple of supported file extensions (including the dot)
         """
-        return self._supported_extensions.copy()
+        return self._supported_extensions
 
 
 class BaseWriter(IWriter[T], ABC):
@@ -255,8 +430,17 @@ class BaseWriter(IWriter[T], ABC):
         Args:
             logger: Optional logger instance
         """
-        self.logger = logger or logging.getLogger(self.__class__.__name__)
-        self._supported_formats: List[str] = []
+        self.logger = logger or _get_logger(self.__class__.__name__)
+        self._supported_formats = []
+    
+    @property
+    def _supported_formats(self) -> Tuple[str, ...]:
+        """Supported formats, kept as a tuple so it can be shared without copying."""
+        return self._supported_formats_tuple
+    
+    @_supported_formats.setter
+    def _supported_formats(self, formats: Sequence[str]) -> None:
+        self._supported_formats_tuple = tuple(sys.intern(fmt) for fmt in formats)
     
     def write(self, content: Dict[str, Any], file_path: Path, **kwargs) -> bool:
         """
@@ -277,19 +461,22 @@ class BaseWriter(IWriter[T], ABC):
             # Ensure output directory exists
             file_path.parent.mkdir(parents=True, exist_ok=True)
             
-            # Write file
-            self.logger.debug(f"Writing file: {file_path}")
-            start_time = time.time()
+            # Write file, timing it only when debug logging is enabled
+            debug = self.logger.isEnabledFor(logging.DEBUG)
+            if debug:
+                self.logger.debug("Writing file: %s", file_path)
+                start_time = time.perf_counter()
             
             result = self._write_impl(content, file_path, **kwargs)
             
-            elapsed_time = time.time() - start_time
-            self.logger.debug(f"File write completed in {elapsed_time:.3f} seconds")
+            if debug:
+                elapsed_time = time.perf_counter() - start_time
+                self.logger.debug("File write completed in %.3f seconds", elapsed_time)
             
             return result
             
         except Exception as e:
-            self.logger.error(f"Failed to write file {file_path}: {e}")
+            self.logger.error("Failed to write file %s: %s", file_path, e)
             raise FileProcessingError(
                 f"Failed to write file: {str(e)}",
                 file_path=file_path,
@@ -312,14 +499,14 @@ class BaseWriter(IWriter[T], ABC):
         """
         pass
     
-    def get_supported_formats(self) -> List[str]:
+    def get_supported_formats(self) -> Tuple[str, ...]:
         """
-        Get list of supported output formats.
+        Get supported output formats.
         
         Returns:
-            List of supported format names
+            Tuple of supported format names
         """
-        return self._supported_formats.copy()
+        return self._supported_formats
 
 
 class BaseValidator(IValidator, ABC):
@@ -336,7 +523,7 @@ class BaseValidator(IValidator, ABC):
         Args:
             logger: Optional logger instance
         """
-        self.logger = logger or logging.getLogger(self.__class__.__name__)
+        self.logger = logger or _get_logger(self.__class__.__name__)
     
     def validate(self, data: Any, **kwargs) -> bool:
         """
@@ -385,29 +572,33 @@ class BasePlugin(IPlugin, ABC):
         """
         self._name = name
         self._version = version
-        self.logger = logger or logging.getLogger(f"Plugin.{name}")
+        self.logger = logger or _get_logger(f"Plugin.{name}")
         self._initialized = False
-        self._config: Dict[str, Any] = {}
+        self._config: Mapping[str, Any] = {}
     
     def initialize(self, config: Dict[str, Any]) -> None:
         """
         Initialize the plugin with configuration.
         
         Args:
-            config: Plugin configuration dictionary
+            config: Plugin configuration dictionary. A read-only
+                MappingProxyType is stored as-is instead of being copied.
             
         Raises:
             PluginError: If initialization fails
         """
         try:
-            self.logger.debug(f"Initializing plugin {self._name}")
-            self._config = config.copy()
+            self.logger.debug("Initializing plugin %s", self._name)
+            if isinstance(config, MappingProxyType):
+                self._config = config
+            else:
+                self._config = config.copy()
             self._initialize_impl(config)
             self._initialized = True
-            self.logger.info(f"Plugin {self._name} initialized successfully")
+            self.logger.info("Plugin %s initialized successfully", self._name)
             
         except Exception as e:
-            self.logger.error(f"Failed to initialize plugin {self._name}: {e}")
+            self.logger.error("Failed to initialize plugin %s: %s", self._name, e)
             raise PluginError(
                 f"Plugin initialization failed: {str(e)}",
                 plugin_name=self._name,
@@ -447,11 +638,11 @@ class BasePlugin(IPlugin, ABC):
             )
         
         try:
-            self.logger.debug(f"Executing plugin {self._name}")
+            self.logger.debug("Executing plugin %s", self._name)
             return self._execute_impl(data, **kwargs)
             
         except Exception as e:
-            self.logger.error(f"Plugin {self._name} execution failed: {e}")
+            self.logger.error("Plugin %s execution failed: %s", self._name, e)
             raise PluginError(
                 f"Plugin execution failed: {str(e)}",
                 plugin_name=self._name,
@@ -492,6 +683,11 @@ class BasePlugin(IPlugin, ABC):
         return self._version
 
 
+def _passthrough(data: Any, **kwargs) -> Any:
+    """Return data unchanged; used for middleware hooks that are not overridden."""
+    return data
+
+
 class BaseMiddleware(IMiddleware, ABC):
     """
     Base implementation for middleware components.
@@ -508,7 +704,17 @@ class BaseMiddleware(IMiddleware, ABC):
             logger: Optional logger instance
         """
         self._name = name
-        self.logger = logger or logging.getLogger(f"Middleware.{name}")
+        self.logger = logger or _get_logger(f"Middleware.{name}")
+        
+        # Bind a plain pass-through for hooks the subclass does not customize,
+        # skipping the logging and error handling wrapper
+        cls = type(self)
+        if (cls._process_before_impl is BaseMiddleware._process_before_impl
+                and cls.process_before is BaseMiddleware.process_before):
+            self.process_before = _passthrough
+        if (cls._process_after_impl is BaseMiddleware._process_after_impl
+                and cls.process_after is BaseMiddleware.process_after):
+            self.process_after = _passthrough
     
     def process_before(self, data: Any, **kwargs) -> Any:
         """
@@ -522,10 +728,10 @@ class BaseMiddleware(IMiddleware, ABC):
             Processed data
         """
         try:
-            self.logger.debug(f"Processing before with middleware {self._name}")
+            self.logger.debug("Processing before with middleware %s", self._name)
             return self._process_before_impl(data, **kwargs)
         except Exception as e:
-            self.logger.error(f"Middleware {self._name} before processing failed: {e}")
+            self.logger.error("Middleware %s before processing failed: %s", self._name, e)
             raise
     
     def process_after(self, data: Any, **kwargs) -> Any:
@@ -540,10 +746,10 @@ class BaseMiddleware(IMiddleware, ABC):
             Processed data
         """
         try:
-            self.logger.debug(f"Processing after with middleware {self._name}")
+            self.logger.debug("Processing after with middleware %s", self._name)
             return self._process_after_impl(data, **kwargs)
         except Exception as e:
-            self.logger.error(f"Middleware {self._name} after processing failed: {e}")
+            self.logger.error("Middleware %s after processing failed: %s", self._name, e)
             raise
     
     def _process_before_impl(self, data: Any, **kwargs) -> Any:
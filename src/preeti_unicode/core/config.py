@@ -5,16 +5,28 @@ This module provides configuration classes and utilities for managing
 application settings, logging, caching, and processing options.
 """
 
-from typing import Any, Dict, List, Optional, Union
-from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, List, Optional, Tuple, Union
+from dataclasses import dataclass, field, replace
 from pathlib import Path
 import os
+import sys
 import json
-import yaml
 from enum import Enum
 
+# orjson is optional; fall back to the stdlib encoder when it is missing
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 from preeti_unicode.core.exceptions import ConfigurationError
 
+# Buffer size for config file reads and writes
+_IO_BUFFER_SIZE = 64 * 1024
+
+# Slotted dataclasses need Python 3.10+; older versions keep a __dict__
+_DATACLASS_OPTIONS: Dict[str, Any] = {'slots': True} if sys.version_info >= (3, 10) else {}
+
 
 class LogLevel(Enum):
     """Logging level enumeration."""
@@ -33,7 +45,95 @@ class CacheType(Enum):
     DISABLED = "disabled"
 
 
-@dataclass
+# Enum members by value; unknown values fall back to the Enum constructor,
+# which raises ValueError as before
+_LOG_LEVEL_BY_VALUE: Dict[str, LogLevel] = {m.value: m for m in LogLevel}
+_CACHE_TYPE_BY_VALUE: Dict[str, CacheType] = {m.value: m for m in CacheType}
+
+
+# Defaults for the dictionary form of each config section, merged under
+# the loaded data in from_dict
+_LOGGING_DEFAULTS: Dict[str, Any] = {
+    'level': LogLevel.INFO.value,
+    'format': "%(asctime)s - %(name)s - %(levelname)s - %(message)s",
+    'file_path': None,
+    'max_file_size': 10 * 1024 * 1024,
+    'backup_count': 5,
+    'console_output': True,
+    'flush_interval': 0.0
+}
+
+_CACHE_DEFAULTS: Dict[str, Any] = {
+    'type': CacheType.MEMORY.value,
+    'max_size': 1000,
+    'ttl_seconds': 3600,
+    'file_path': None,
+    'redis_url': None,
+    'redis_db': 0
+}
+
+_PROCESSING_DEFAULTS: Dict[str, Any] = {
+    'max_workers': 4,
+    'chunk_size': 1000,
+    'timeout_seconds': 300.0,
+    'retry_attempts': 3,
+    'retry_delay': 1.0,
+    'enable_progress_tracking': True
+}
+
+_FONT_DEFAULTS: Dict[str, Any] = {
+    'custom_mappings': None,
+    'font_files': None,
+    'default_font': 'preeti',
+    'enable_auto_detection': True
+}
+
+
+def _parse_log_level(value: str) -> LogLevel:
+    """Parse the dictionary form of a log level."""
+    return _LOG_LEVEL_BY_VALUE.get(value) or LogLevel(value)
+
+
+def _parse_cache_type(value: str) -> CacheType:
+    """Parse the dictionary form of a cache type."""
+    return _CACHE_TYPE_BY_VALUE.get(value) or CacheType(value)
+
+
+def _parse_optional_path(value: Optional[str]) -> Optional[Path]:
+    """Parse an optional path, treating empty values as unset."""
+    return Path(value) if value else None
+
+
+def _parse_custom_mappings(value: Optional[Dict[str, str]]) -> Dict[str, str]:
+    """Parse the custom font mappings, treating None as empty."""
+    return value if value is not None else {}
+
+
+def _parse_font_files(value: Optional[Dict[str, str]]) -> Dict[str, Path]:
+    """Parse the font file paths, treating None as empty."""
+    return {k: Path(v) for k, v in value.items()} if value is not None else {}
+
+
+# Dictionary-form defaults and value parsers of each Configuration section,
+# used by Configuration.merge; keys without a parser are stored as given
+_SECTION_SCHEMAS: Dict[str, Tuple[Dict[str, Any], Dict[str, Callable[[Any], Any]]]] = {
+    'logging': (_LOGGING_DEFAULTS, {
+        'level': _parse_log_level,
+        'file_path': _parse_optional_path,
+    }),
+    'cache': (_CACHE_DEFAULTS, {
+        'type': _parse_cache_type,
+        'file_path': _parse_optional_path,
+    }),
+    'processing': (_PROCESSING_DEFAULTS, {}),
+    'fonts': (_FONT_DEFAULTS, {
+        'custom_mappings': _parse_custom_mappings,
+        'font_files': _parse_font_files,
+    }),
+}
+
+
+@dataclass(**_DATACLASS_OPTIONS)
 class LoggingConfig:
     """Configuration for logging settings."""
     level: LogLevel = LogLevel.INFO
@@ -42,6 +142,7 @@ class LoggingConfig:
     max_file_size: int = 10 * 1024 * 1024  # 10MB
     backup_count: int = 5
     console_output: bool = True
+    flush_interval: float = 0.0  # seconds between file flushes; 0 flushes every record
     
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary format."""
@@ -51,23 +152,26 @@ class LoggingConfig:
             'file_path': str(self.file_path) if self.file_path else None,
             'max_file_size': self.max_file_size,
             'backup_count': self.backup_count,
-            'console_output': self.console_output
+            'console_output': self.console_output,
+            'flush_interval': self.flush_interval
         }
     
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> 'LoggingConfig':
         """Create from dictionary format."""
+        merged = {**_LOGGING_DEFAULTS, **data}
         return cls(
-            level=LogLevel(data.get('level', LogLevel.INFO.value)),
-            format=data.get('format', "%(asctime)s - %(name)s - %(levelname)s - %(message)s"),
-            file_path=Path(data['file_path']) if data.get('file_path') else None,
-            max_file_size=data.get('max_file_size', 10 * 1024 * 1024),
-            backup_count=data.get('backup_count', 5),
-            console_output=data.get('console_output', True)
+            level=_parse_log_level(merged['level']),
+            format=merged['format'],
+            file_path=_parse_optional_path(merged['file_path']),
+            max_file_size=merged['max_file_size'],
+            backup_count=merged['backup_count'],
+            console_output=merged['console_output'],
+            flush_interval=merged['flush_interval']
         )
 
 
-@dataclass
+@dataclass(**_DATACLASS_OPTIONS)
 class CacheConfig:
     """Configuration for caching settings."""
     type: CacheType = CacheType.MEMORY
@@ -91,17 +195,18 @@ class CacheConfig:
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> 'CacheConfig':
         """Create from dictionary format."""
+        merged = {**_CACHE_DEFAULTS, **data}
         return cls(
-            type=CacheType(data.get('type', CacheType.MEMORY.value)),
-            max_size=data.get('max_size', 1000),
-            ttl_seconds=data.get('ttl_seconds', 3600),
-            file_path=Path(data['file_path']) if data.get('file_path') else None,
-            redis_url=data.get('redis_url'),
-            redis_db=data.get('redis_db', 0)
+            type=_parse_cache_type(merged['type']),
+            max_size=merged['max_size'],
+            ttl_seconds=merged['ttl_seconds'],
+            file_path=_parse_optional_path(merged['file_path']),
+            redis_url=merged['redis_url'],
+            redis_db=merged['redis_db']
         )
 
 
-@dataclass
+@dataclass(**_DATACLASS_OPTIONS)
 class ProcessingConfig:
     """Configuration for processing settings."""
     max_workers: int = 4
@@ -125,17 +230,18 @@ class ProcessingConfig:
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> 'ProcessingConfig':
         """Create from dictionary format."""
+        merged = {**_PROCESSING_DEFAULTS, **data}
         return cls(
-            max_workers=data.get('max_workers', 4),
-            chunk_size=data.get('chunk_size', 1000),
-            timeout_seconds=data.get('timeout_seconds', 300.0),
-            retry_attempts=data.get('retry_attempts', 3),
-            retry_delay=data.get('retry_delay', 1.0),
-            enable_progress_tracking=data.get('enable_progress_tracking', True)
+            max_workers=merged['max_workers'],
+            chunk_size=merged['chunk_size'],
+            timeout_seconds=merged['timeout_seconds'],
+            retry_attempts=merged['retry_attempts'],
+            retry_delay=merged['retry_delay'],
+            enable_progress_tracking=merged['enable_progress_tracking']
         )
 
 
-@dataclass
+@dataclass(**_DATACLASS_OPTIONS)
 class FontConfig:
     """Configuration for font mappings and custom fonts."""
     custom_mappings: Dict[str, str] = field(default_factory=dict)
@@ -155,19 +261,115 @@ class FontConfig:
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> 'FontConfig':
         """Create from dictionary format."""
-        font_files = {}
-        if 'font_files' in data:
-            font_files = {k: Path(v) for k, v in data['font_files'].items()}
-        
+        merged = {**_FONT_DEFAULTS, **data}
         return cls(
-            custom_mappings=data.get('custom_mappings', {}),
-            font_files=font_files,
-            default_font=data.get('default_font', 'preeti'),
-            enable_auto_detection=data.get('enable_auto_detection', True)
+            custom_mappings=_parse_custom_mappings(merged['custom_mappings']),
+            font_files=_parse_font_files(merged['font_files']),
+            default_font=merged['default_font'],
+            enable_auto_detection=merged['enable_auto_detection']
+        )
+
+
+def _import_yaml() -> Tuple[Any, Any, Any]:
+    """
+    Import PyYAML on first use, so it is only loaded for YAML config files.
+    
+    Returns:
+        Tuple of (yaml module, safe loader class, safe dumper class), preferring
+        the libyaml-backed classes when available
+    """
+    import yaml
+    try:
+        from yaml import CSafeLoader as loader, CSafeDumper as dumper
+    except ImportError:
+        from yaml import SafeLoader as loader, SafeDumper as dumper
+    return yaml, loader, dumper
+
+
+# Environment variables, keyed by the name without its prefix, mapped to the
+# (section, key, parser) that produces their dictionary-form value
+_ENV_HANDLERS: Dict[str, Tuple[str, str, Callable[[str], Any]]] = {
+    'LOG_LEVEL': ('logging', 'level', lambda v: _LOG_LEVEL_BY_VALUE[v].value),
+    'LOG_FILE': ('logging', 'file_path', str),
+    'CACHE_TYPE': ('cache', 'type', lambda v: _CACHE_TYPE_BY_VALUE[v].value),
+    'CACHE_MAX_SIZE': ('cache', 'max_size', int),
+    'MAX_WORKERS': ('processing', 'max_workers', int),
+    'TIMEOUT': ('processing', 'timeout_seconds', float),
+}
+
+
+def _read_env_data(prefix: str) -> Dict[str, Dict[str, Any]]:
+    """
+    Collect the configuration values set through environment variables.
+    
+    Args:
+        prefix: Prefix for environment variables
+        
+    Returns:
+        Dictionary-form configuration holding only the keys that are set;
+        variables with invalid values are ignored
+    """
+    data: Dict[str, Dict[str, Any]] = {}
+    plen = len(prefix)
+    for key, value in os.environ.items():
+        if not key.startswith(prefix):
+            continue
+        handler = _ENV_HANDLERS.get(key[plen:])
+        if handler is None:
+            continue
+        section, name, parse = handler
+        try:
+            data.setdefault(section, {})[name] = parse(value)
+        except (KeyError, ValueError):
+            pass
+    return data
+
+
+def _read_file_data(file_path: Path) -> Dict[str, Any]:
+    """
+    Read the dictionary form of a configuration file.
+    
+    Args:
+        file_path: Path to the configuration file
+        
+    Returns:
+        Parsed configuration data
+        
+    Raises:
+        ConfigurationError: If the file is missing, unsupported or unreadable
+    """
+    try:
+        if not file_path.exists():
+            raise ConfigurationError(
+                f"Configuration file not found: {file_path}",
+                config_key="file_path"
+            )
+        
+        with open(file_path, 'r', encoding='utf-8', buffering=_IO_BUFFER_SIZE) as f:
+            if file_path.suffix.lower() == '.json':
+                data = orjson.loads(f.read()) if orjson is not None else json.load(f)
+            elif file_path.suffix.lower() in ['.yml', '.yaml']:
+                yaml, yaml_loader, _ = _import_yaml()
+                data = yaml.load(f, Loader=yaml_loader)
+            else:
+                raise ConfigurationError(
+                    f"Unsupported configuration file format: {file_path.suffix}",
+                    config_key="file_format"
+                )
+        
+        return data
+        
+    except ConfigurationError:
+        raise
+    except Exception as e:
+        raise ConfigurationError(
+            f"Failed to load configuration from {file_path}: {str(e)}",
+            config_key="file_path",
+            cause=e
         )
 
 
-@dataclass
+@dataclass(**_DATACLASS_OPTIONS)
 class Configuration:
     """Main configuration class containing all settings."""
     logging: LoggingConfig = field(default_factory=LoggingConfig)
@@ -200,6 +402,41 @@ class Configuration:
             middleware=data.get('middleware', [])
         )
     
+    def merge(self, data: Dict[str, Any]) -> 'Configuration':
+        """
+        Merge dictionary-form settings on top of this configuration.
+        
+        Only the keys present in ``data`` are parsed and applied, so a source
+        can set a value back to its default and untouched fields are kept
+        as they are. Plugin settings are merged by name, and non-empty
+        middleware lists replace the current ones.
+        
+        Args:
+            data: Configuration data with higher precedence, in the format
+                produced by ``to_dict``
+            
+        Returns:
+            New merged configuration instance
+        """
+        changes: Dict[str, Any] = {}
+        for name, (defaults, parsers) in _SECTION_SCHEMAS.items():
+            section_data = data.get(name)
+            if not section_data:
+                continue
+            fields = {
+                key: parsers[key](value) if key in parsers else value
+                for key, value in section_data.items()
+                if key in defaults
+            }
+            if fields:
+                changes[name] = replace(getattr(self, name), **fields)
+        
+        if data.get('plugins'):
+            changes['plugins'] = {**self.plugins, **data['plugins']}
+        if data.get('middleware'):
+            changes['middleware'] = data['middleware']
+        return replace(self, **changes) if changes else self
+    
     def save_to_file(self, file_path: Path) -> None:
         """
         Save configuration to file.
@@ -216,11 +453,17 @@ class Configuration:
             data = self.to_dict()
             
             if file_path.suffix.lower() == '.json':
-                with open(file_path, 'w', encoding='utf-8') as f:
-                    json.dump(data, f, indent=2, ensure_ascii=False)
+                if orjson is not None:
+                    file_path.write_bytes(orjson.dumps(
+                        data, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS
+                    ))
+                else:
+                    with open(file_path, 'w', encoding='utf-8', buffering=_IO_BUFFER_SIZE) as f:
+                        json.dump(data, f, indent=2, ensure_ascii=False)
             elif file_path.suffix.lower() in ['.yml', '.yaml']:
-                with open(file_path, 'w', encoding='utf-8') as f:
-                    yaml.dump(data, f, default_flow_style=False, allow_unicode=True)
+                yaml, _, yaml_dumper = _import_yaml()
+                with open(file_path, 'w', encoding='utf-8', buffering=_IO_BUFFER_SIZE) as f:
+                    yaml.dump(data, f, Dumper=yaml_dumper, default_flow_style=False, allow_unicode=True)
             else:
                 raise ConfigurationError(
                     f"Unsupported configuration file format: {file_path.suffix}",
@@ -248,28 +491,9 @@ class Configuration:
         Raises:
             ConfigurationError: If loading fails
         """
+        data = _read_file_data(file_path)
         try:
-            if not file_path.exists():
-                raise ConfigurationError(
-                    f"Configuration file not found: {file_path}",
-                    config_key="file_path"
-                )
-            
-            with open(file_path, 'r', encoding='utf-8') as f:
-                if file_path.suffix.lower() == '.json':
-                    data = json.load(f)
-                elif file_path.suffix.lower() in ['.yml', '.yaml']:
-                    data = yaml.safe_load(f)
-                else:
-                    raise ConfigurationError(
-                        f"Unsupported configuration file format: {file_path.suffix}",
-                        config_key="file_format"
-                    )
-            
             return cls.from_dict(data)
-            
-        except ConfigurationError:
-            raise
         except Exception as e:
             raise ConfigurationError(
                 f"Failed to load configuration from {file_path}: {str(e)}",
@@ -288,45 +512,7 @@ class Configuration:
         Returns:
             Configuration instance with values from environment
         """
-        config = cls()
-        
-        # Logging configuration
-        if f"{prefix}LOG_LEVEL" in os.environ:
-            try:
-                config.logging.level = LogLevel(os.environ[f"{prefix}LOG_LEVEL"])
-            except ValueError:
-                pass
-        
-        if f"{prefix}LOG_FILE" in os.environ:
-            config.logging.file_path = Path(os.environ[f"{prefix}LOG_FILE"])
-        
-        # Cache configuration
-        if f"{prefix}CACHE_TYPE" in os.environ:
-            try:
-                config.cache.type = CacheType(os.environ[f"{prefix}CACHE_TYPE"])
-            except ValueError:
-                pass
-        
-        if f"{prefix}CACHE_MAX_SIZE" in os.environ:
-            try:
-                config.cache.max_size = int(os.environ[f"{prefix}CACHE_MAX_SIZE"])
-            except ValueError:
-                pass
-        
-        # Processing configuration
-        if f"{prefix}MAX_WORKERS" in os.environ:
-            try:
-                config.processing.max_workers = int(os.environ[f"{prefix}MAX_WORKERS"])
-            except ValueError:
-                pass
-        
-        if f"{prefix}TIMEOUT" in os.environ:
-            try:
-                config.processing.timeout_seconds = float(os.environ[f"{prefix}TIMEOUT"])
-            except ValueError:
-                pass
-        
-        return config
+        return cls().merge(_read_env_data(prefix))
 
 
 def get_default_config() -> Configuration:
@@ -360,14 +546,19 @@ def load_config(
     else:
         config = Configuration()
     
-    # Load from file if provided
+    # Load from file if provided (file takes precedence)
     if file_path and file_path.exists():
-        file_config = Configuration.load_from_file(file_path)
-        # Merge configurations (file takes precedence)
-        config = Configuration.from_dict({**config.to_dict(), **file_config.to_dict()})
+        data = _read_file_data(file_path)
+        try:
+            config = config.merge(data)
+        except Exception as e:
+            raise ConfigurationError(
+                f"Failed to load configuration from {file_path}: {str(e)}",
+                config_key="file_path",
+                cause=e
+            )
     
     # Load from environment (takes highest precedence)
-    env_config = Configuration.load_from_env(env_prefix)
-    config = Configuration.from_dict({**config.to_dict(), **env_config.to_dict()})
+    config = config.merge(_read_env_data(env_prefix))
     
     return config
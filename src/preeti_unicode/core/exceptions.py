@@ -18,6 +18,14 @@ class PreetiUnicodeError(Exception):
     It provides common functionality for error handling and reporting.
     """
     
+    # Error code used when none is given; set to the class name per subclass
+    _default_error_code = "PreetiUnicodeError"
+    
+    def __init_subclass__(cls, **kwargs):
+        """Record the subclass name as its default error code."""
+        super().__init_subclass__(**kwargs)
+        cls._default_error_code = cls.__name__
+    
     def __init__(
         self,
         message: str,
@@ -36,32 +44,73 @@ class PreetiUnicodeError(Exception):
         """
         super().__init__(message)
         self.message = message
-        self.error_code = error_code or self.__class__.__name__
+        self.error_code = error_code or self._default_error_code
         self.details = details or {}
         self.cause = cause
+        self._cached_dict: Optional[Dict[str, Any]] = None
+        self._cached_cause: Optional[Exception] = None
+    
+    @staticmethod
+    def _merge_details(kwargs: Dict[str, Any], **fields: Any) -> None:
+        """
+        Add the fields that are not None to the details passed in kwargs.
+        
+        Args:
+            kwargs: Keyword arguments destined for the base constructor
+            **fields: Detail entries to add
+        """
+        details = kwargs.get('details')
+        for key, value in fields.items():
+            if value is not None:
+                if details is None:
+                    details = kwargs['details'] = {}
+                details[key] = value
     
     def __str__(self) -> str:
         """Return string representation of the error."""
-        result = f"{self.error_code}: {self.message}"
+        parts = [self.error_code, ": ", self.message]
         if self.details:
-            details_str = ", ".join(f"{k}={v}" for k, v in self.details.items())
-            result += f" ({details_str})"
-        return result
+            parts.append(" (")
+            first = True
+            for key, value in self.details.items():
+                if not first:
+                    parts.append(", ")
+                parts.append(key)
+                parts.append("=")
+                parts.append(value if isinstance(value, str) else str(value))
+                first = False
+            parts.append(")")
+        return "".join(parts)
     
     def to_dict(self) -> Dict[str, Any]:
         """
         Convert exception to dictionary format.
         
+        The dictionary is reused until message, error_code, details or cause
+        is reassigned, so callers should treat it as read-only.
+        
         Returns:
             Dictionary representation of the exception
         """
-        return {
+        cached = self._cached_dict
+        if (
+            cached is not None
+            and cached["details"] is self.details
+            and cached["message"] is self.message
+            and cached["error_code"] is self.error_code
+            and self._cached_cause is self.cause
+        ):
+            return cached
+        
+        self._cached_cause = self.cause
+        cached = self._cached_dict = {
             "error_code": self.error_code,
             "message": self.message,
             "details": self.details,
             "type": self.__class__.__name__,
             "cause": str(self.cause) if self.cause else None
         }
+        return cached
 
 
 class ConversionError(PreetiUnicodeError):
@@ -84,18 +133,27 @@ class ConversionError(PreetiUnicodeError):
         
         Args:
             message: Error message
-            input_text: The text that failed to convert
+            input_text: The text that failed to convert; kept in full on
+                ``input_text``, with a shortened preview in the details
             conversion_type: Type of conversion that failed
             **kwargs: Additional arguments for base class
         """
-        details = kwargs.get('details', {})
-        if input_text is not None:
-            details['input_text'] = input_text[:100] + "..." if len(input_text) > 100 else input_text
-        if conversion_type is not None:
-            details['conversion_type'] = conversion_type
+        self.input_text = input_text
         
-        kwargs['details'] = details
+        self._merge_details(
+            kwargs,
+            input_text=self.input_text_preview,
+            conversion_type=conversion_type
+        )
         super().__init__(message, **kwargs)
+    
+    @property
+    def input_text_preview(self) -> Optional[str]:
+        """Input text shortened to 100 characters for messages and details."""
+        text = self.input_text
+        if text is None or len(text) <= 100:
+            return text
+        return text[:100] + "..."
 
 
 class FileProcessingError(PreetiUnicodeError):
@@ -121,13 +179,11 @@ class FileProcessingError(PreetiUnicodeError):
             operation: The operation that failed (read, write, validate, etc.)
             **kwargs: Additional arguments for base class
         """
-        details = kwargs.get('details', {})
-        if file_path is not None:
-            details['file_path'] = str(file_path)
-        if operation is not None:
-            details['operation'] = operation
-        
-        kwargs['details'] = details
+        self._merge_details(
+            kwargs,
+            file_path=str(file_path) if file_path is not None else None,
+            operation=operation
+        )
         super().__init__(message, **kwargs)
 
 
@@ -155,13 +211,11 @@ class ValidationError(PreetiUnicodeError):
             field_name: Name of the field that failed validation
             **kwargs: Additional arguments for base class
         """
-        details = kwargs.get('details', {})
-        if validation_errors is not None:
-            details['validation_errors'] = validation_errors
-        if field_name is not None:
-            details['field_name'] = field_name
-        
-        kwargs['details'] = details
+        self._merge_details(
+            kwargs,
+            validation_errors=validation_errors,
+            field_name=field_name
+        )
         super().__init__(message, **kwargs)
 
 
@@ -188,13 +242,11 @@ class PluginError(PreetiUnicodeError):
             plugin_version: Version of the plugin
             **kwargs: Additional arguments for base class
         """
-        details = kwargs.get('details', {})
-        if plugin_name is not None:
-            details['plugin_name'] = plugin_name
-        if plugin_version is not None:
-            details['plugin_version'] = plugin_version
-        
-        kwargs['details'] = details
+        self._merge_details(
+            kwargs,
+            plugin_name=plugin_name,
+            plugin_version=plugin_version
+        )
         super().__init__(message, **kwargs)
 
 
@@ -221,13 +273,11 @@ class CacheError(PreetiUnicodeError):
             operation: The cache operation that failed
             **kwargs: Additional arguments for base class
         """
-        details = kwargs.get('details', {})
-        if cache_key is not None:
-            details['cache_key'] = str(cache_key)
-        if operation is not None:
-            details['operation'] = operation
-        
-        kwargs['details'] = details
+        self._merge_details(
+            kwargs,
+            cache_key=str(cache_key) if cache_key is not None else None,
+            operation=operation
+        )
         super().__init__(message, **kwargs)
 
 
@@ -255,13 +305,11 @@ class ConfigurationError(PreetiUnicodeError):
             expected_type: The expected type for the configuration value
             **kwargs: Additional arguments for base class
         """
-        details = kwargs.get('details', {})
-        if config_key is not None:
-            details['config_key'] = config_key
-        if expected_type is not None:
-            details['expected_type'] = expected_type
-        
-        kwargs['details'] = details
+        self._merge_details(
+            kwargs,
+            config_key=config_key,
+            expected_type=expected_type
+        )
         super().__init__(message, **kwargs)
 
 
@@ -291,15 +339,12 @@ class DependencyError(PreetiUnicodeError):
             available_version: Available version of the dependency
             **kwargs: Additional arguments for base class
         """
-        details = kwargs.get('details', {})
-        if dependency_name is not None:
-            details['dependency_name'] = dependency_name
-        if required_version is not None:
-            details['required_version'] = required_version
-        if available_version is not None:
-            details['available_version'] = available_version
-        
-        kwargs['details'] = details
+        self._merge_details(
+            kwargs,
+            dependency_name=dependency_name,
+            required_version=required_version,
+            available_version=available_version
+        )
         super().__init__(message, **kwargs)
 
 
@@ -327,11 +372,9 @@ class ProcessingTimeoutError(PreetiUnicodeError):
             operation: The operation that timed out
             **kwargs: Additional arguments for base class
         """
-        details = kwargs.get('details', {})
-        if timeout_seconds is not None:
-            details['timeout_seconds'] = timeout_seconds
-        if operation is not None:
-            details['operation'] = operation
-        
-        kwargs['details'] = details
+        self._merge_details(
+            kwargs,
+            timeout_seconds=timeout_seconds,
+            operation=operation
+        )
         super().__init__(message, **kwargs)
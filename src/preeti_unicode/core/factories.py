@@ -5,9 +5,10 @@ This module implements the Factory pattern to provide a centralized way
 to create instances of various components based on configuration or type.
 """
 
-from typing import Dict, Type, Optional, Any, List
+from typing import Callable, Dict, Type, Optional, Any, List, Tuple
 from pathlib import Path
 import logging
+import sys
 
 from preeti_unicode.core.interfaces import IReader, IWriter, IConverter, IValidator
 from preeti_unicode.core.exceptions import ConfigurationError, DependencyError
@@ -23,19 +24,41 @@ class ComponentRegistry:
     
     def __init__(self):
         """Initialize the component registry."""
-        self._components: Dict[str, Dict[str, Type]] = {
-            'readers': {},
-            'writers': {},
-            'converters': {},
-            'validators': {}
-        }
-        self._aliases: Dict[str, Dict[str, str]] = {
-            'readers': {},
-            'writers': {},
-            'converters': {},
-            'validators': {}
+        self.readers: Dict[str, Type] = {}
+        self.writers: Dict[str, Type] = {}
+        self.converters: Dict[str, Type] = {}
+        self.validators: Dict[str, Type] = {}
+        
+        self.readers_aliases: Dict[str, str] = {}
+        self.writers_aliases: Dict[str, str] = {}
+        self.converters_aliases: Dict[str, str] = {}
+        self.validators_aliases: Dict[str, str] = {}
+        
+        # (components, aliases) by component type, resolved in a single lookup
+        self._by_type: Dict[str, Tuple[Dict[str, Type], Dict[str, str]]] = {
+            'readers': (self.readers, self.readers_aliases),
+            'writers': (self.writers, self.writers_aliases),
+            'converters': (self.converters, self.converters_aliases),
+            'validators': (self.validators, self.validators_aliases)
         }
     
+    def _register(self, component_type: str, name: str, component_class: Type, aliases: Optional[List[str]]) -> None:
+        """
+        Register a component class and its aliases.
+        
+        Args:
+            component_type: Type of component ('readers', 'writers', etc.)
+            name: Name of the component
+            component_class: Component class to register
+            aliases: Optional list of aliases for the component
+        """
+        # Intern keys so lookups with literal names match by identity
+        name = sys.intern(name)
+        components, component_aliases = self._by_type[component_type]
+        components[name] = component_class
+        if aliases:
+            component_aliases.update(dict.fromkeys(map(sys.intern, aliases), name))
+    
     def register_reader(self, name: str, reader_class: Type[IReader], aliases: Optional[List[str]] = None) -> None:
         """
         Register a reader class.
@@ -45,10 +68,7 @@ class ComponentRegistry:
             reader_class: Reader class to register
             aliases: Optional list of aliases for the reader
         """
-        self._components['readers'][name] = reader_class
-        if aliases:
-            for alias in aliases:
-                self._aliases['readers'][alias] = name
+        self._register('readers', name, reader_class, aliases)
     
     def register_writer(self, name: str, writer_class: Type[IWriter], aliases: Optional[List[str]] = None) -> None:
         """
@@ -59,10 +79,7 @@ class ComponentRegistry:
             writer_class: Writer class to register
             aliases: Optional list of aliases for the writer
         """
-        self._components['writers'][name] = writer_class
-        if aliases:
-            for alias in aliases:
-                self._aliases['writers'][alias] = name
+        self._register('writers', name, writer_class, aliases)
     
     def register_converter(self, name: str, converter_class: Type[IConverter], aliases: Optional[List[str]] = None) -> None:
         """
@@ -73,10 +90,7 @@ class ComponentRegistry:
             converter_class: Converter class to register
             aliases: Optional list of aliases for the converter
         """
-        self._components['converters'][name] = converter_class
-        if aliases:
-            for alias in aliases:
-                self._aliases['converters'][alias] = name
+        self._register('converters', name, converter_class, aliases)
     
     def register_validator(self, name: str, validator_class: Type[IValidator], aliases: Optional[List[str]] = None) -> None:
         """
@@ -87,10 +101,7 @@ class ComponentRegistry:
             validator_class: Validator class to register
             aliases: Optional list of aliases for the validator
         """
-        self._components['validators'][name] = validator_class
-        if aliases:
-            for alias in aliases:
-                self._aliases['validators'][alias] = name
+        self._register('validators', name, validator_class, aliases)
     
     def get_component_class(self, component_type: str, name: str) -> Type:
         """
@@ -106,21 +117,22 @@ class ComponentRegistry:
         Raises:
             ConfigurationError: If component is not found
         """
-        # Check if it's an alias
-        if name in self._aliases.get(component_type, {}):
-            name = self._aliases[component_type][name]
-        
-        # Get the component class
-        if component_type not in self._components:
+        entry = self._by_type.get(component_type)
+        if entry is None:
             raise ConfigurationError(f"Unknown component type: {component_type}")
+        components, aliases = entry
+        
+        # Resolve aliases to the registered name
+        name = aliases.get(name, name)
         
-        if name not in self._components[component_type]:
-            available = list(self._components[component_type].keys())
+        # Get the component class; the available names are only listed on a miss
+        component_class = components.get(name)
+        if component_class is None:
             raise ConfigurationError(
-                f"Unknown {component_type[:-1]}: {name}. Available: {available}"
+                f"Unknown {component_type[:-1]}: {name}. Available: {list(components)}"
             )
         
-        return self._components[component_type][name]
+        return component_class
     
     def list_components(self, component_type: str) -> List[str]:
         """
@@ -132,12 +144,22 @@ class ComponentRegistry:
         Returns:
             List of component names
         """
-        return list(self._components.get(component_type, {}).keys())
+        entry = self._by_type.get(component_type)
+        return list(entry[0]) if entry is not None else []
 
 
 # Global component registry
 _registry = ComponentRegistry()
 
+# File extension to reader type mapping used for auto-detection
+_EXTENSION_MAP: Dict[str, str] = {
+    '.pdf': 'pdf',
+    '.docx': 'docx',
+    '.doc': 'docx',
+    '.txt': 'txt',
+    '.text': 'txt'
+}
+
 
 class BaseFactory:
     """
@@ -147,6 +169,9 @@ class BaseFactory:
     including error handling and logging.
     """
     
+    # Registry component type created by this factory ('readers', 'writers', ...)
+    _COMPONENT_TYPE: Optional[str] = None
+    
     def __init__(self, logger: Optional[logging.Logger] = None):
         """
         Initialize the base factory.
@@ -156,6 +181,41 @@ class BaseFactory:
         """
         self.logger = logger or logging.getLogger(self.__class__.__name__)
         self.registry = _registry
+        
+        # Resolve this factory's component and alias dicts once
+        if self._COMPONENT_TYPE is not None:
+            self._components, self._aliases = self.registry._by_type[self._COMPONENT_TYPE]
+    
+    def _create(self, name: str, **kwargs):
+        """
+        Create an instance of this factory's component type.
+        
+        Args:
+            name: Name or alias of the component
+            **kwargs: Keyword arguments for the component constructor
+            
+        Returns:
+            Component instance
+            
+        Raises:
+            ConfigurationError: If component creation fails
+        """
+        component_class = self._components.get(self._aliases.get(name, name))
+        if component_class is None:
+            # Unknown names take the generic path, which reports what is available
+            return self._create_instance(self._COMPONENT_TYPE, name, **kwargs)
+        
+        if self.logger.isEnabledFor(logging.DEBUG):
+            self.logger.debug("Creating %s instance: %s", self._COMPONENT_TYPE[:-1], name)
+        try:
+            return component_class(**kwargs)
+        except Exception as e:
+            self.logger.error("Failed to create %s %s: %s", self._COMPONENT_TYPE[:-1], name, e)
+            raise ConfigurationError(
+                f"Failed to create {self._COMPONENT_TYPE[:-1]} {name}: {str(e)}",
+                config_key=name,
+                cause=e
+            )
     
     def _create_instance(self, component_type: str, name: str, *args, **kwargs):
         """
@@ -175,10 +235,11 @@ class BaseFactory:
         """
         try:
             component_class = self.registry.get_component_class(component_type, name)
-            self.logger.debug(f"Creating {component_type[:-1]} instance: {name}")
+            if self.logger.isEnabledFor(logging.DEBUG):
+                self.logger.debug("Creating %s instance: %s", component_type[:-1], name)
             return component_class(*args, **kwargs)
         except Exception as e:
-            self.logger.error(f"Failed to create {component_type[:-1]} {name}: {e}")
+            self.logger.error("Failed to create %s %s: %s", component_type[:-1], name, e)
             raise ConfigurationError(
                 f"Failed to create {component_type[:-1]} {name}: {str(e)}",
                 config_key=name,
@@ -194,6 +255,8 @@ class ReaderFactory(BaseFactory):
     or explicit reader specification.
     """
     
+    _COMPONENT_TYPE = 'readers'
+    
     def create_reader(self, reader_type: Optional[str] = None, file_path: Optional[Path] = None, **kwargs) -> IReader:
         """
         Create a reader instance.
@@ -216,7 +279,7 @@ class ReaderFactory(BaseFactory):
         if reader_type is None:
             reader_type = self._detect_reader_type(file_path)
         
-        return self._create_instance('readers', reader_type, **kwargs)
+        return self._create(reader_type, **kwargs)
     
     def _detect_reader_type(self, file_path: Path) -> str:
         """
@@ -231,24 +294,17 @@ class ReaderFactory(BaseFactory):
         Raises:
             ConfigurationError: If file type is not supported
         """
-        extension = file_path.suffix.lower()
-        
-        # Extension to reader type mapping
-        extension_map = {
-            '.pdf': 'pdf',
-            '.docx': 'docx',
-            '.doc': 'docx',
-            '.txt': 'txt',
-            '.text': 'txt'
-        }
+        extension = file_path.suffix
         
-        if extension not in extension_map:
+        # Most paths already use lowercase extensions, so try them as-is first
+        reader_type = _EXTENSION_MAP.get(extension) or _EXTENSION_MAP.get(extension.lower())
+        if reader_type is None:
             raise ConfigurationError(
-                f"Unsupported file extension: {extension}",
+                f"Unsupported file extension: {extension.lower()}",
                 config_key="file_extension"
             )
         
-        return extension_map[extension]
+        return reader_type
     
     def list_available_readers(self) -> List[str]:
         """
@@ -267,6 +323,8 @@ class WriterFactory(BaseFactory):
     This factory creates appropriate writer instances based on output format.
     """
     
+    _COMPONENT_TYPE = 'writers'
+    
     def create_writer(self, writer_type: str, **kwargs) -> IWriter:
         """
         Create a writer instance.
@@ -278,7 +336,7 @@ class WriterFactory(BaseFactory):
         Returns:
             Writer instance
         """
-        return self._create_instance('writers', writer_type, **kwargs)
+        return self._create(writer_type, **kwargs)
     
     def list_available_writers(self) -> List[str]:
         """
@@ -297,6 +355,8 @@ class ConverterFactory(BaseFactory):
     This factory creates appropriate converter instances based on conversion type.
     """
     
+    _COMPONENT_TYPE = 'converters'
+    
     def create_converter(self, converter_type: str, **kwargs) -> IConverter:
         """
         Create a converter instance.
@@ -308,7 +368,7 @@ class ConverterFactory(BaseFactory):
         Returns:
             Converter instance
         """
-        return self._create_instance('converters', converter_type, **kwargs)
+        return self._create(converter_type, **kwargs)
     
     def list_available_converters(self) -> List[str]:
         """
@@ -327,6 +387,8 @@ class ValidatorFactory(BaseFactory):
     This factory creates appropriate validator instances based on validation type.
     """
     
+    _COMPONENT_TYPE = 'validators'
+    
     def create_validator(self, validator_type: str, **kwargs) -> IValidator:
         """
         Create a validator instance.
@@ -338,7 +400,7 @@ class ValidatorFactory(BaseFactory):
         Returns:
             Validator instance
         """
-        return self._create_instance('validators', validator_type, **kwargs)
+        return self._create(validator_type, **kwargs)
     
     def list_available_validators(self) -> List[str]:
         """
@@ -350,11 +412,42 @@ class ValidatorFactory(BaseFactory):
         return self.registry.list_components('validators')
 
 
-# Global factory instances
-reader_factory = ReaderFactory()
-writer_factory = WriterFactory()
-converter_factory = ConverterFactory()
-validator_factory = ValidatorFactory()
+# Global factory instances, created on first access through __getattr__
+_FACTORY_CLASSES: Dict[str, Type[BaseFactory]] = {
+    'reader_factory': ReaderFactory,
+    'writer_factory': WriterFactory,
+    'converter_factory': ConverterFactory,
+    'validator_factory': ValidatorFactory
+}
+
+
+def __getattr__(name: str) -> Any:
+    """
+    Create the global factory instances lazily.
+    
+    Args:
+        name: Module attribute name
+        
+    Returns:
+        Global factory instance
+        
+    Raises:
+        AttributeError: If the name is not a global factory
+    """
+    factory_class = _FACTORY_CLASSES.get(name)
+    if factory_class is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    # Cache in the module namespace so later lookups bypass __getattr__
+    return globals().setdefault(name, factory_class())
+
+
+# Registration method for each component type accepted by register_component
+_REGISTER_DISPATCH: Dict[str, Callable[[str, Type, Optional[List[str]]], None]] = {
+    'reader': _registry.register_reader,
+    'writer': _registry.register_writer,
+    'converter': _registry.register_converter,
+    'validator': _registry.register_validator
+}
 
 
 def register_component(component_type: str, name: str, component_class: Type, aliases: Optional[List[str]] = None) -> None:
@@ -367,13 +460,7 @@ def register_component(component_type: str, name: str, component_class: Type, al
         component_class: Component class to register
         aliases: Optional list of aliases
     """
-    if component_type == 'reader':
-        _registry.register_reader(name, component_class, aliases)
-    elif component_type == 'writer':
-        _registry.register_writer(name, component_class, aliases)
-    elif component_type == 'converter':
-        _registry.register_converter(name, component_class, aliases)
-    elif component_type == 'validator':
-        _registry.register_validator(name, component_class, aliases)
-    else:
+    register = _REGISTER_DISPATCH.get(component_type)
+    if register is None:
         raise ConfigurationError(f"Unknown component type: {component_type}")
+    register(name, component_class, aliases)
@@ -5,8 +5,9 @@ This module defines all the interfaces that components must implement
 to ensure consistency and extensibility throughout the system.
 """
 
-from abc import ABC, abstractmethod
-from typing import Any, Dict, List, Optional, Union, Generic, TypeVar, Protocol
+from typing import (
+    Any, Dict, Iterable, List, Mapping, Optional, Tuple, Union, Generic, TypeVar, Protocol
+)
 from pathlib import Path
 from enum import Enum
 
@@ -34,10 +35,9 @@ class LogLevel(Enum):
     CRITICAL = "critical"
 
 
-class IConverter(ABC, Generic[T]):
+class IConverter(Generic[T]):
     """Interface for text conversion operations."""
     
-    @abstractmethod
     def convert(self, text: str, **kwargs) -> str:
         """
         Convert text from one format to another.
@@ -49,9 +49,8 @@ class IConverter(ABC, Generic[T]):
         Returns:
             Converted text
         """
-        pass
+        raise NotImplementedError
     
-    @abstractmethod
     def validate_input(self, text: str) -> bool:
         """
         Validate if the input text is suitable for conversion.
@@ -62,23 +61,21 @@ class IConverter(ABC, Generic[T]):
         Returns:
             True if valid, False otherwise
         """
-        pass
+        raise NotImplementedError
     
-    @abstractmethod
-    def get_supported_formats(self) -> List[str]:
+    def get_supported_formats(self) -> Tuple[str, ...]:
         """
-        Get list of supported input formats.
+        Get supported input formats.
         
         Returns:
-            List of supported format names
+            Tuple of supported format names
         """
-        pass
+        raise NotImplementedError
 
 
-class IReader(ABC, Generic[T]):
+class IReader(Generic[T]):
     """Interface for file reading operations."""
     
-    @abstractmethod
     def read(self, file_path: Path, **kwargs) -> Dict[str, Any]:
         """
         Read content from a file.
@@ -90,9 +87,8 @@ class IReader(ABC, Generic[T]):
         Returns:
             Dictionary containing extracted content and metadata
         """
-        pass
+        raise NotImplementedError
     
-    @abstractmethod
     def validate_file(self, file_path: Path) -> bool:
         """
         Validate if the file can be read by this reader.
@@ -103,23 +99,21 @@ class IReader(ABC, Generic[T]):
         Returns:
             True if file is valid and readable, False otherwise
         """
-        pass
+        raise NotImplementedError
     
-    @abstractmethod
-    def get_supported_extensions(self) -> List[str]:
+    def get_supported_extensions(self) -> Tuple[str, ...]:
         """
-        Get list of supported file extensions.
+        Get supported file extensions.
         
         Returns:
-            List of supported file extensions (including the dot)
+            Tuple of supported file extensions (including the dot)
         """
-        pass
+        raise NotImplementedError
 
 
-class IWriter(ABC, Generic[T]):
+class IWriter(Generic[T]):
     """Interface for file writing operations."""
     
-    @abstractmethod
     def write(self, content: Dict[str, Any], file_path: Path, **kwargs) -> bool:
         """
         Write content to a file.
@@ -132,23 +126,21 @@ class IWriter(ABC, Generic[T]):
         Returns:
             True if successful, False otherwise
         """
-        pass
+        raise NotImplementedError
     
-    @abstractmethod
-    def get_supported_formats(self) -> List[str]:
+    def get_supported_formats(self) -> Tuple[str, ...]:
         """
-        Get list of supported output formats.
+        Get supported output formats.
         
         Returns:
-            List of supported format names
+            Tuple of supported format names
         """
-        pass
+        raise NotImplementedError
 
 
-class IValidator(ABC):
+class IValidator:
     """Interface for validation operations."""
     
-    @abstractmethod
     def validate(self, data: Any, **kwargs) -> bool:
         """
         Validate the given data.
@@ -160,9 +152,8 @@ class IValidator(ABC):
         Returns:
             True if valid, False otherwise
         """
-        pass
+        raise NotImplementedError
     
-    @abstractmethod
     def get_validation_errors(self, data: Any, **kwargs) -> List[str]:
         """
         Get detailed validation errors for the given data.
@@ -174,13 +165,15 @@ class IValidator(ABC):
         Returns:
             List of validation error messages
         """
-        pass
+        raise NotImplementedError
 
 
-class ICache(ABC, Generic[K, V]):
+class ICache(Generic[K, V]):
     """Interface for caching operations."""
     
-    @abstractmethod
+    # Empty so implementations can define __slots__ of their own
+    __slots__ = ()
+    
     def get(self, key: K) -> Optional[V]:
         """
         Get value from cache.
@@ -191,9 +184,8 @@ class ICache(ABC, Generic[K, V]):
         Returns:
             Cached value or None if not found
         """
-        pass
+        raise NotImplementedError
     
-    @abstractmethod
     def set(self, key: K, value: V, ttl: Optional[int] = None) -> None:
         """
         Set value in cache.
@@ -203,9 +195,8 @@ class ICache(ABC, Generic[K, V]):
             value: Value to cache
             ttl: Time to live in seconds (optional)
         """
-        pass
+        raise NotImplementedError
     
-    @abstractmethod
     def delete(self, key: K) -> bool:
         """
         Delete value from cache.
@@ -216,18 +207,49 @@ class ICache(ABC, Generic[K, V]):
         Returns:
             True if deleted, False if key not found
         """
-        pass
+        raise NotImplementedError
     
-    @abstractmethod
     def clear(self) -> None:
         """Clear all cached values."""
-        pass
+        raise NotImplementedError
+    
+    def get_many(self, keys: Iterable[K]) -> Dict[K, V]:
+        """
+        Get several values from cache.
+        
+        The default implementation calls ``get`` per key; implementations
+        can override it to amortize locking and bookkeeping.
+        
+        Args:
+            keys: Cache keys
+            
+        Returns:
+            Dictionary of the keys that were found
+        """
+        results = {}
+        for key in keys:
+            value = self.get(key)
+            if value is not None:
+                results[key] = value
+        return results
+    
+    def set_many(self, items: Mapping[K, V], ttl: Optional[int] = None) -> None:
+        """
+        Set several values in cache.
+        
+        The default implementation calls ``set`` per item.
+        
+        Args:
+            items: Mapping of cache keys to values
+            ttl: Time to live in seconds (optional)
+        """
+        for key, value in items.items():
+            self.set(key, value, ttl)
 
 
-class ILogger(ABC):
+class ILogger:
     """Interface for logging operations."""
     
-    @abstractmethod
     def log(self, level: LogLevel, message: str, **kwargs) -> None:
         """
         Log a message at the specified level.
@@ -237,38 +259,32 @@ class ILogger(ABC):
             message: Message to log
             **kwargs: Additional context data
         """
-        pass
+        raise NotImplementedError
     
-    @abstractmethod
     def debug(self, message: str, **kwargs) -> None:
         """Log debug message."""
-        pass
+        raise NotImplementedError
     
-    @abstractmethod
     def info(self, message: str, **kwargs) -> None:
         """Log info message."""
-        pass
+        raise NotImplementedError
     
-    @abstractmethod
     def warning(self, message: str, **kwargs) -> None:
         """Log warning message."""
-        pass
+        raise NotImplementedError
     
-    @abstractmethod
     def error(self, message: str, **kwargs) -> None:
         """Log error message."""
-        pass
+        raise NotImplementedError
     
-    @abstractmethod
     def critical(self, message: str, **kwargs) -> None:
         """Log critical message."""
-        pass
+        raise NotImplementedError
 
 
-class IPlugin(ABC):
+class IPlugin:
     """Interface for plugin components."""
     
-    @abstractmethod
     def initialize(self, config: Dict[str, Any]) -> None:
         """
         Initialize the plugin with configuration.
@@ -276,9 +292,8 @@ class IPlugin(ABC):
         Args:
             config: Plugin configuration dictionary
         """
-        pass
+        raise NotImplementedError
     
-    @abstractmethod
     def execute(self, data: Any, **kwargs) -> Any:
         """
         Execute the plugin's main functionality.
@@ -290,9 +305,8 @@ class IPlugin(ABC):
         Returns:
             Processed data
         """
-        pass
+        raise NotImplementedError
     
-    @abstractmethod
     def get_name(self) -> str:
         """
         Get the plugin name.
@@ -300,9 +314,8 @@ class IPlugin(ABC):
         Returns:
             Plugin name
         """
-        pass
+        raise NotImplementedError
     
-    @abstractmethod
     def get_version(self) -> str:
         """
         Get the plugin version.
@@ -310,13 +323,12 @@ class IPlugin(ABC):
         Returns:
             Plugin version string
         """
-        pass
+        raise NotImplementedError
 
 
-class IMiddleware(ABC):
+class IMiddleware:
     """Interface for middleware components."""
     
-    @abstractmethod
     def process_before(self, data: Any, **kwargs) -> Any:
         """
         Process data before main operation.
@@ -328,9 +340,8 @@ class IMiddleware(ABC):
         Returns:
             Processed data
         """
-        pass
+        raise NotImplementedError
     
-    @abstractmethod
     def process_after(self, data: Any, **kwargs) -> Any:
         """
         Process data after main operation.
@@ -342,13 +353,12 @@ class IMiddleware(ABC):
         Returns:
             Processed data
         """
-        pass
+        raise NotImplementedError
 
 
-class IProgressTracker(ABC):
+class IProgressTracker:
     """Interface for progress tracking operations."""
     
-    @abstractmethod
     def start(self, total: int, description: str = "") -> None:
         """
         Start progress tracking.
@@ -357,9 +367,8 @@ class IProgressTracker(ABC):
             total: Total number of items to process
             description: Description of the operation
         """
-        pass
+        raise NotImplementedError
     
-    @abstractmethod
     def update(self, current: int, message: str = "") -> None:
         """
         Update progress.
@@ -368,9 +377,8 @@ class IProgressTracker(ABC):
             current: Current progress count
             message: Optional progress message
         """
-        pass
+        raise NotImplementedError
     
-    @abstractmethod
     def finish(self, message: str = "") -> None:
         """
         Finish progress tracking.
@@ -378,9 +386,8 @@ class IProgressTracker(ABC):
         Args:
             message: Optional completion message
         """
-        pass
+        raise NotImplementedError
     
-    @abstractmethod
     def get_status(self) -> ProcessingStatus:
         """
         Get current processing status.
@@ -388,4 +395,4 @@ class IProgressTracker(ABC):
         Returns:
             Current status
         """
-        pass
+        raise NotImplementedError
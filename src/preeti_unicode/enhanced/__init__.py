@@ -30,6 +30,7 @@ from preeti_unicode.enhanced.cache import (
 from preeti_unicode.enhanced.logging_system import (
     LoggingManager,
     StructuredLogger,
+    AsyncStructuredLogger,
     setup_logging
 )
 
@@ -56,7 +57,7 @@ __all__ = [
     'CacheManager', 'MemoryCache', 'FileCache', 'create_cache',
     
     # Logging
-    'LoggingManager', 'StructuredLogger', 'setup_logging',
+    'LoggingManager', 'StructuredLogger', 'AsyncStructuredLogger', 'setup_logging',
     
     # PDF Processing
     'PDFIntegrityValidator', 'EnhancedPDFReader',
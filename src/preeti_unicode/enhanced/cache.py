@@ -10,12 +10,12 @@ import pickle
 import hashlib
 import time
 import threading
-from typing import Any, Dict, Optional, Union, TypeVar, Generic
+from typing import Any, Callable, Dict, Iterable, Mapping, Optional, Union, TypeVar, Generic
 from pathlib import Path
 import logging
 from abc import ABC, abstractmethod
-from dataclasses import dataclass
 from collections import OrderedDict
+from functools import lru_cache
 
 from preeti_unicode.core.interfaces import ICache
 from preeti_unicode.core.exceptions import CacheError
@@ -25,29 +25,54 @@ K = TypeVar('K')
 V = TypeVar('V')
 
 
-@dataclass
 class CacheEntry:
     """Represents a cache entry with metadata."""
-    value: Any
-    created_at: float
-    ttl: Optional[float] = None
-    access_count: int = 0
-    last_accessed: float = 0
-    
-    def __post_init__(self):
-        if self.last_accessed == 0:
-            self.last_accessed = self.created_at
-    
-    def is_expired(self) -> bool:
-        """Check if the cache entry has expired."""
-        if self.ttl is None:
-            return False
-        return time.time() - self.created_at > self.ttl
     
-    def touch(self) -> None:
-        """Update access metadata."""
+    __slots__ = ('value', 'created_at', 'ttl', 'access_count', 'last_accessed')
+    
+    def __init__(
+        self,
+        value: Any,
+        created_at: float,
+        ttl: Optional[float] = None,
+        access_count: int = 0,
+        last_accessed: float = 0
+    ):
+        self.value = value
+        self.created_at = created_at
+        self.ttl = ttl
+        self.access_count = access_count
+        self.last_accessed = last_accessed if last_accessed != 0 else created_at
+    
+    def __repr__(self) -> str:
+        return (
+            f"CacheEntry(value={self.value!r}, created_at={self.created_at!r}, "
+            f"ttl={self.ttl!r}, access_count={self.access_count!r}, "
+            f"last_accessed={self.last_accessed!r})"
+        )
+    
+    def is_expired(self, now: float) -> bool:
+        """
+        Check if the cache entry has expired.
+        
+        Args:
+            now: Current time on the clock the owning cache stamps entries
+                with (``created_at`` and ``last_accessed``)
+            
+        Returns:
+            True if the entry has expired, False otherwise
+        """
+        return self.ttl is not None and now - self.created_at > self.ttl
+    
+    def touch(self, now: float) -> None:
+        """
+        Update access metadata.
+        
+        Args:
+            now: Current time on the clock the owning cache stamps entries with
+        """
         self.access_count += 1
-        self.last_accessed = time.time()
+        self.last_accessed = now
 
 
 class MemoryCache(ICache[K, V]):
@@ -58,32 +83,44 @@ class MemoryCache(ICache[K, V]):
     size limits and TTL support.
     """
     
+    __slots__ = (
+        'max_size', 'default_ttl', 'track_access', 'logger', '_cache', '_lock',
+        '_hits', '_misses', '_evictions', '_expired'
+    )
+    
     def __init__(
         self,
         max_size: int = 1000,
         default_ttl: Optional[float] = None,
-        logger: Optional[logging.Logger] = None
+        logger: Optional[logging.Logger] = None,
+        track_access: bool = False
     ):
         """
         Initialize the memory cache.
         
+        Entries are timestamped with ``time.monotonic``, which is cheaper than
+        wall-clock time and unaffected by system clock changes.
+        
         Args:
             max_size: Maximum number of entries to store
             default_ttl: Default time-to-live in seconds
             logger: Optional logger instance
+            track_access: Whether to record access count and last access time
+                on entries
         """
         self.max_size = max_size
         self.default_ttl = default_ttl
+        self.track_access = track_access
         self.logger = logger or logging.getLogger(self.__class__.__name__)
         
         self._cache: OrderedDict[K, CacheEntry] = OrderedDict()
-        self._lock = threading.RLock()
-        self._stats = {
-            'hits': 0,
-            'misses': 0,
-            'evictions': 0,
-            'expired': 0
-        }
+        # No method re-enters the lock, so a plain Lock is enough and is
+        # cheaper to acquire than an RLock
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+        self._expired = 0
     
     def get(self, key: K) -> Optional[V]:
         """
@@ -95,28 +132,65 @@ class MemoryCache(ICache[K, V]):
         Returns:
             Cached value or None if not found or expired
         """
+        now = time.monotonic()
         with self._lock:
-            if key not in self._cache:
-                self._stats['misses'] += 1
-                return None
-            
-            entry = self._cache[key]
-            
-            # Check if expired
-            if entry.is_expired():
-                del self._cache[key]
-                self._stats['expired'] += 1
-                self._stats['misses'] += 1
-                return None
-            
-            # Update access metadata
-            entry.touch()
+            return self._get_locked(key, now)
+    
+    def get_many(self, keys: Iterable[K], *, now: Optional[float] = None) -> Dict[K, V]:
+        """
+        Get several values from cache under a single lock acquisition.
+        
+        Args:
+            keys: Cache keys
+            now: Current ``time.monotonic`` value, so callers processing
+                several batches can share one clock read
             
-            # Move to end (most recently used)
-            self._cache.move_to_end(key)
+        Returns:
+            Dictionary of the keys that were found and not expired
+        """
+        if now is None:
+            now = time.monotonic()
+        
+        results = {}
+        with self._lock:
+            for key in keys:
+                value = self._get_locked(key, now)
+                if value is not None:
+                    results[key] = value
+        return results
+    
+    def _get_locked(self, key: K, now: float) -> Optional[V]:
+        """
+        Look up a key; the caller must hold the lock.
+        
+        Args:
+            key: Cache key
+            now: Current ``time.monotonic`` value
             
-            self._stats['hits'] += 1
-            return entry.value
+        Returns:
+            Cached value or None if not found or expired
+        """
+        entry = self._cache.get(key)
+        if entry is None:
+            self._misses += 1
+            return None
+        
+        # Check if expired
+        if entry.is_expired(now):
+            del self._cache[key]
+            self._expired += 1
+            self._misses += 1
+            return None
+        
+        # Update access metadata
+        if self.track_access:
+            entry.touch(now)
+        
+        # Move to end (most recently used)
+        self._cache.move_to_end(key)
+        
+        self._hits += 1
+        return entry.value
     
     def set(self, key: K, value: V, ttl: Optional[float] = None) -> None:
         """
@@ -135,7 +209,7 @@ class MemoryCache(ICache[K, V]):
             # Create cache entry
             entry = CacheEntry(
                 value=value,
-                created_at=time.time(),
+                created_at=time.monotonic(),
                 ttl=ttl
             )
             
@@ -146,6 +220,27 @@ class MemoryCache(ICache[K, V]):
             # Evict if necessary
             self._evict_if_needed()
     
+    def set_many(self, items: Mapping[K, V], ttl: Optional[float] = None) -> None:
+        """
+        Set several values in cache under a single lock acquisition.
+        
+        Args:
+            items: Mapping of cache keys to values
+            ttl: Time to live in seconds (uses default if None)
+        """
+        if ttl is None:
+            ttl = self.default_ttl
+        now = time.monotonic()
+        
+        with self._lock:
+            cache = self._cache
+            for key, value in items.items():
+                cache[key] = CacheEntry(value=value, created_at=now, ttl=ttl)
+                cache.move_to_end(key)
+            
+            # Evict if necessary
+            self._evict_if_needed()
+    
     def delete(self, key: K) -> bool:
         """
         Delete value from cache.
@@ -166,20 +261,17 @@ class MemoryCache(ICache[K, V]):
         """Clear all cached values."""
         with self._lock:
             self._cache.clear()
-            self._stats = {
-                'hits': 0,
-                'misses': 0,
-                'evictions': 0,
-                'expired': 0
-            }
+            self._hits = 0
+            self._misses = 0
+            self._evictions = 0
+            self._expired = 0
     
     def _evict_if_needed(self) -> None:
         """Evict least recently used entries if cache is full."""
         while len(self._cache) > self.max_size:
             # Remove least recently used item
-            oldest_key = next(iter(self._cache))
-            del self._cache[oldest_key]
-            self._stats['evictions'] += 1
+            self._cache.popitem(last=False)
+            self._evictions += 1
     
     def get_stats(self) -> Dict[str, Any]:
         """
@@ -189,14 +281,17 @@ class MemoryCache(ICache[K, V]):
             Dictionary containing cache statistics
         """
         with self._lock:
-            total_requests = self._stats['hits'] + self._stats['misses']
-            hit_rate = self._stats['hits'] / total_requests if total_requests > 0 else 0
+            total_requests = self._hits + self._misses
+            hit_rate = self._hits / total_requests if total_requests > 0 else 0
             
             return {
                 'size': len(self._cache),
                 'max_size': self.max_size,
                 'hit_rate': hit_rate,
-                **self._stats
+                'hits': self._hits,
+                'misses': self._misses,
+                'evictions': self._evictions,
+                'expired': self._expired
             }
     
     def cleanup_expired(self) -> int:
@@ -207,19 +302,32 @@ class MemoryCache(ICache[K, V]):
             Number of expired entries removed
         """
         with self._lock:
-            expired_keys = []
-            
-            for key, entry in self._cache.items():
-                if entry.is_expired():
-                    expired_keys.append(key)
+            now = time.monotonic()
+            expired_keys = [
+                key for key, entry in self._cache.items() if entry.is_expired(now)
+            ]
             
             for key in expired_keys:
                 del self._cache[key]
-                self._stats['expired'] += 1
+                self._expired += 1
             
             return len(expired_keys)
 
 
+@lru_cache(maxsize=4096)
+def _cache_filename(key: str) -> str:
+    """
+    Create a safe cache filename from a key.
+    
+    Args:
+        key: Cache key
+        
+    Returns:
+        Filename derived from a BLAKE2b hash of the key
+    """
+    return hashlib.blake2b(key.encode(), digest_size=16).hexdigest() + ".cache"
+
+
 class FileCache(ICache[str, Any]):
     """
     File-based cache implementation.
@@ -253,6 +361,10 @@ class FileCache(ICache[str, Any]):
         self.cache_dir.mkdir(parents=True, exist_ok=True)
         
         self._lock = threading.RLock()
+        
+        # Cache filenames from least to most recently used, built from the
+        # directory on first eviction check and maintained from then on
+        self._index: Optional[OrderedDict[str, None]] = None
     
     def get(self, key: str) -> Optional[Any]:
         """
@@ -267,24 +379,27 @@ class FileCache(ICache[str, Any]):
         try:
             cache_file = self._get_cache_file(key)
             
-            if not cache_file.exists():
-                return None
-            
             with self._lock:
-                with open(cache_file, 'rb') as f:
-                    entry = pickle.load(f)
+                try:
+                    with open(cache_file, 'rb') as f:
+                        entry = pickle.loads(f.read())
+                except FileNotFoundError:
+                    return None
                 
                 # Check if expired
-                if entry.is_expired():
+                # Entries on disk are stamped with wall-clock time, which
+                # stays meaningful across processes
+                if entry.is_expired(time.time()):
                     cache_file.unlink()
+                    self._forget(cache_file.name)
                     return None
                 
-                # Update access metadata
-                entry.touch()
-                
-                # Save updated metadata
-                with open(cache_file, 'wb') as f:
-                    pickle.dump(entry, f)
+                # Bump the modification time so eviction stays least recently
+                # used, without rewriting the entry
+                os.utime(cache_file)
+                if self._index is not None:
+                    self._index[cache_file.name] = None
+                    self._index.move_to_end(cache_file.name)
                 
                 return entry.value
                 
@@ -317,11 +432,14 @@ class FileCache(ICache[str, Any]):
             
             with self._lock:
                 with open(cache_file, 'wb') as f:
-                    pickle.dump(entry, f)
-            
-            # Evict if necessary
-            if self.max_size:
-                self._evict_if_needed()
+                    f.write(pickle.dumps(entry, protocol=pickle.HIGHEST_PROTOCOL))
+                
+                # Evict if necessary
+                if self.max_size:
+                    index = self._get_index()
+                    index[cache_file.name] = None
+                    index.move_to_end(cache_file.name)
+                    self._evict_if_needed()
                 
         except Exception as e:
             self.logger.error(f"Failed to set cache entry {key}: {e}")
@@ -345,12 +463,14 @@ class FileCache(ICache[str, Any]):
         try:
             cache_file = self._get_cache_file(key)
             
-            if cache_file.exists():
-                cache_file.unlink()
+            with self._lock:
+                self._forget(cache_file.name)
+                try:
+                    cache_file.unlink()
+                except FileNotFoundError:
+                    return False
                 return True
             
-            return False
-            
         except Exception as e:
             self.logger.error(f"Failed to delete cache entry {key}: {e}")
             return False
@@ -358,8 +478,10 @@ class FileCache(ICache[str, Any]):
     def clear(self) -> None:
         """Clear all cached files."""
         try:
-            for cache_file in self.cache_dir.glob("*.cache"):
-                cache_file.unlink()
+            with self._lock:
+                self._index = None
+                for cache_file in self.cache_dir.glob("*.cache"):
+                    cache_file.unlink()
         except Exception as e:
             self.logger.error(f"Failed to clear cache: {e}")
     
@@ -373,25 +495,59 @@ class FileCache(ICache[str, Any]):
         Returns:
             Path to cache file
         """
-        # Create a safe filename from the key
-        key_hash = hashlib.md5(key.encode()).hexdigest()
-        return self.cache_dir / f"{key_hash}.cache"
+        return self.cache_dir / _cache_filename(key)
     
-    def _evict_if_needed(self) -> None:
-        """Evict oldest cache files if limit is exceeded."""
-        cache_files = list(self.cache_dir.glob("*.cache"))
+    def reindex(self) -> None:
+        """
+        Rebuild the eviction index from the cache directory.
+        
+        Only needed when other processes write to the same directory.
+        """
+        with self._lock:
+            cache_files = []
+            for cache_file in self.cache_dir.glob("*.cache"):
+                try:
+                    cache_files.append((cache_file.stat().st_mtime, cache_file.name))
+                except FileNotFoundError:
+                    continue
+            
+            # Sort by modification time (oldest first)
+            cache_files.sort()
+            self._index = OrderedDict.fromkeys(name for _, name in cache_files)
+    
+    def _get_index(self) -> 'OrderedDict[str, None]':
+        """
+        Get the eviction index, scanning the cache directory on first use.
         
-        if len(cache_files) <= self.max_size:
-            return
+        Returns:
+            Cache filenames ordered from least to most recently used
+        """
+        if self._index is None:
+            self.reindex()
+        return self._index
+    
+    def _forget(self, name: str) -> None:
+        """
+        Drop a cache filename from the eviction index.
         
-        # Sort by modification time (oldest first)
-        cache_files.sort(key=lambda f: f.stat().st_mtime)
+        Args:
+            name: Cache filename
+        """
+        if self._index is not None:
+            self._index.pop(name, None)
+    
+    def _evict_if_needed(self) -> None:
+        """Evict least recently used cache files if limit is exceeded."""
+        index = self._get_index()
         
         # Remove oldest files
-        files_to_remove = len(cache_files) - self.max_size
-        for cache_file in cache_files[:files_to_remove]:
+        while len(index) > self.max_size:
+            name, _ = index.popitem(last=False)
+            cache_file = self.cache_dir / name
             try:
                 cache_file.unlink()
+            except FileNotFoundError:
+                pass
             except Exception as e:
                 self.logger.error(f"Failed to evict cache file {cache_file}: {e}")
 
@@ -429,8 +585,43 @@ class CacheManager:
         if is_default or self._default_cache is None:
             self._default_cache = name
         
+        if self._default_cache == name:
+            self._bind_default_fast_path(cache)
+        
         self.logger.debug(f"Added cache: {name}")
     
+    def _bind_default_fast_path(self, cache: ICache) -> None:
+        """
+        Specialize get/set/delete for a disabled default cache.
+        
+        When the default cache is a NoOpCache, calls without a cache name are
+        answered directly instead of resolving and dispatching to the cache.
+        
+        Args:
+            cache: The new default cache
+        """
+        if isinstance(cache, NoOpCache):
+            self.get = self._get_disabled
+            self.set = self._set_disabled
+            self.delete = self._delete_disabled
+        else:
+            for method in ('get', 'set', 'delete'):
+                self.__dict__.pop(method, None)
+    
+    def _get_disabled(self, key: Any, cache_name: Optional[str] = None) -> Optional[Any]:
+        if cache_name is None:
+            return None
+        return type(self).get(self, key, cache_name)
+    
+    def _set_disabled(self, key: Any, value: Any, ttl: Optional[float] = None, cache_name: Optional[str] = None) -> None:
+        if cache_name is not None:
+            type(self).set(self, key, value, ttl, cache_name)
+    
+    def _delete_disabled(self, key: Any, cache_name: Optional[str] = None) -> bool:
+        if cache_name is None:
+            return False
+        return type(self).delete(self, key, cache_name)
+    
     def get_cache(self, name: Optional[str] = None) -> Optional[ICache]:
         """
         Get a cache instance by name.
@@ -514,26 +705,37 @@ def create_cache(config: CacheConfig, logger: Optional[logging.Logger] = None) -
     Raises:
         CacheError: If cache type is not supported
     """
-    if config.type == CacheType.MEMORY:
-        return MemoryCache(
-            max_size=config.max_size,
-            default_ttl=config.ttl_seconds,
-            logger=logger
-        )
-    elif config.type == CacheType.FILE:
-        if config.file_path is None:
-            raise CacheError("File path is required for file cache")
-        
-        return FileCache(
-            cache_dir=config.file_path,
-            default_ttl=config.ttl_seconds,
-            max_size=config.max_size,
-            logger=logger
-        )
-    elif config.type == CacheType.DISABLED:
-        return NoOpCache()
-    else:
+    builder = _CACHE_BUILDERS.get(config.type)
+    if builder is None:
         raise CacheError(f"Unsupported cache type: {config.type}")
+    return builder(config, logger)
+
+
+def _build_memory_cache(config: CacheConfig, logger: Optional[logging.Logger]) -> ICache:
+    """Create a memory cache from configuration."""
+    return MemoryCache(
+        max_size=config.max_size,
+        default_ttl=config.ttl_seconds,
+        logger=logger
+    )
+
+
+def _build_file_cache(config: CacheConfig, logger: Optional[logging.Logger]) -> ICache:
+    """Create a file cache from configuration."""
+    if config.file_path is None:
+        raise CacheError("File path is required for file cache")
+    
+    return FileCache(
+        cache_dir=config.file_path,
+        default_ttl=config.ttl_seconds,
+        max_size=config.max_size,
+        logger=logger
+    )
+
+
+def _build_noop_cache(config: CacheConfig, logger: Optional[logging.Logger]) -> ICache:
+    """Create a cache that stores nothing."""
+    return NoOpCache()
 
 
 class NoOpCache(ICache):
@@ -542,9 +744,15 @@ class NoOpCache(ICache):
     def get(self, key: Any) -> Optional[Any]:
         return None
     
+    def get_many(self, keys: Iterable[Any]) -> Dict[Any, Any]:
+        return {}
+    
     def set(self, key: Any, value: Any, ttl: Optional[float] = None) -> None:
         pass
     
+    def set_many(self, items: Mapping[Any, Any], ttl: Optional[float] = None) -> None:
+        pass
+    
     def delete(self, key: Any) -> bool:
         return False
     
@@ -552,6 +760,14 @@ class NoOpCache(ICache):
         pass
 
 
+# Cache builders by configured cache type, used by create_cache
+_CACHE_BUILDERS: Dict[CacheType, Callable[[CacheConfig, Optional[logging.Logger]], ICache]] = {
+    CacheType.MEMORY: _build_memory_cache,
+    CacheType.FILE: _build_file_cache,
+    CacheType.DISABLED: _build_noop_cache
+}
+
+
 # Global cache manager instance
 _cache_manager = CacheManager()
 
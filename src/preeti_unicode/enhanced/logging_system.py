@@ -5,24 +5,74 @@ This module provides comprehensive logging capabilities including
 structured logging, multiple output formats, and performance monitoring.
 """
 
+import copy
 import logging
 import logging.handlers
 import json
+import queue
+import sys
 import time
 import threading
-from typing import Any, Dict, Optional, List, Union
+from typing import Any, Dict, Optional, List, Tuple, Union
 from pathlib import Path
-from datetime import datetime
 from dataclasses import dataclass, asdict
 from contextlib import contextmanager
+from enum import Enum
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 from preeti_unicode.core.interfaces import ILogger, LogLevel
-from preeti_unicode.core.config import LoggingConfig
+from preeti_unicode.core.config import LoggingConfig, LogLevel as ConfigLogLevel
+
+
+# LogRecord attributes that are never treated as extra data
+_STD_ATTRS = frozenset({
+    'name', 'msg', 'args', 'levelname', 'levelno', 'pathname',
+    'filename', 'module', 'lineno', 'funcName', 'created',
+    'msecs', 'relativeCreated', 'thread', 'threadName',
+    'processName', 'process', 'getMessage', 'exc_info',
+    'exc_text', 'stack_info'
+})
+
+# Standard library levels for both the interface and config LogLevel enums
+_LEVEL_MAP: Dict[Enum, int] = {
+    level: getattr(logging, level.name)
+    for level_enum in (LogLevel, ConfigLogLevel)
+    for level in level_enum
+}
+
+# Write buffer for file handlers that flush on an interval
+_WRITE_BUFFER_SIZE = 64 * 1024
+
+# Slotted dataclasses need Python 3.10+; older versions keep a __dict__
+_DATACLASS_OPTIONS: Dict[str, Any] = {'slots': True} if sys.version_info >= (3, 10) else {}
+
+
+def _dumps_bytes(data: Dict[str, Any]) -> bytes:
+    """Serialize a log entry dictionary to UTF-8 encoded JSON."""
+    if orjson is not None:
+        return orjson.dumps(data, default=str, option=orjson.OPT_NON_STR_KEYS)
+    return json.dumps(data, default=str).encode('utf-8')
+
 
+def _dumps(data: Dict[str, Any]) -> str:
+    """Serialize a log entry dictionary to a JSON string."""
+    if orjson is not None:
+        return orjson.dumps(data, default=str, option=orjson.OPT_NON_STR_KEYS).decode()
+    return json.dumps(data, default=str)
 
-@dataclass
+
+@dataclass(**_DATACLASS_OPTIONS)
 class LogEntry:
-    """Structured log entry with metadata."""
+    """
+    Structured log entry with metadata.
+    
+    StructuredFormatter emits the same fields without building a
+    LogEntry; this class is kept for callers that want a typed record.
+    """
     timestamp: str
     level: str
     logger_name: str
@@ -60,6 +110,51 @@ class StructuredFormatter(logging.Formatter):
         """
         super().__init__()
         self.include_extra = include_extra
+        # (second, formatted prefix) of the last timestamp, swapped as one object
+        self._timestamp_cache = (-1, '')
+    
+    def _format_timestamp(self, created: float) -> str:
+        """
+        Format a record time like datetime.fromtimestamp(created).isoformat().
+        
+        The second-resolution prefix is cached, so records logged within
+        the same second only format the microseconds.
+        """
+        seconds = int(created)
+        microseconds = round((created - seconds) * 1e6)
+        if microseconds >= 1000000:
+            seconds += 1
+            microseconds -= 1000000
+        
+        cached_seconds, prefix = self._timestamp_cache
+        if seconds != cached_seconds:
+            prefix = time.strftime('%Y-%m-%dT%H:%M:%S', time.localtime(seconds))
+            self._timestamp_cache = (seconds, prefix)
+        
+        return f"{prefix}.{microseconds:06d}" if microseconds else prefix
+    
+    def _record_dict(self, record: logging.LogRecord) -> Dict[str, Any]:
+        """Build the structured entry for a record; keys match LogEntry's fields."""
+        # Extract extra data
+        extra_data = None
+        if self.include_extra:
+            extra_data = {
+                key: value for key, value in record.__dict__.items()
+                if key not in _STD_ATTRS
+            }
+        
+        return {
+            'timestamp': self._format_timestamp(record.created),
+            'level': record.levelname,
+            'logger_name': record.name,
+            'message': record.getMessage(),
+            'module': record.module,
+            'function': record.funcName,
+            'line_number': record.lineno,
+            'thread_id': record.thread,
+            'process_id': record.process,
+            'extra_data': extra_data or None
+        }
     
     def format(self, record: logging.LogRecord) -> str:
         """
@@ -71,35 +166,108 @@ class StructuredFormatter(logging.Formatter):
         Returns:
             Formatted log entry as JSON string
         """
-        # Extract extra data
-        extra_data = {}
-        if self.include_extra:
-            # Get all extra attributes from the record
-            for key, value in record.__dict__.items():
-                if key not in {
-                    'name', 'msg', 'args', 'levelname', 'levelno', 'pathname',
-                    'filename', 'module', 'lineno', 'funcName', 'created',
-                    'msecs', 'relativeCreated', 'thread', 'threadName',
-                    'processName', 'process', 'getMessage', 'exc_info',
-                    'exc_text', 'stack_info'
-                }:
-                    extra_data[key] = value
-        
-        # Create structured log entry
-        log_entry = LogEntry(
-            timestamp=datetime.fromtimestamp(record.created).isoformat(),
-            level=record.levelname,
-            logger_name=record.name,
-            message=record.getMessage(),
-            module=record.module,
-            function=record.funcName,
-            line_number=record.lineno,
-            thread_id=record.thread,
-            process_id=record.process,
-            extra_data=extra_data if extra_data else None
-        )
+        return _dumps(self._record_dict(record))
+    
+    def format_bytes(self, record: logging.LogRecord) -> bytes:
+        """
+        Format a log record as UTF-8 encoded structured JSON.
         
-        return log_entry.to_json()
+        Args:
+            record: Log record to format
+            
+        Returns:
+            Formatted log entry as JSON bytes, without a line terminator
+        """
+        return _dumps_bytes(self._record_dict(record))
+
+
+# Shared by every structured logger; its timestamp cache is safe to use from many threads
+_STRUCTURED_FORMATTER = StructuredFormatter()
+
+
+class BytesRotatingFileHandler(logging.handlers.RotatingFileHandler):
+    """
+    Rotating file handler that writes encoded records to a binary stream.
+    
+    Formatters providing format_bytes() (such as StructuredFormatter)
+    are written without a str round trip; other formatters' output is
+    encoded as UTF-8.
+    
+    With a positive flush_interval, records collect in a 64 KiB write
+    buffer that a background thread flushes every flush_interval
+    seconds (ERROR and above are flushed immediately). This turns many
+    small writes into few large ones, at the cost of losing up to one
+    interval of records if the process dies without closing the handler.
+    """
+    
+    def __init__(self, *args, flush_interval: float = 0.0, **kwargs):
+        """
+        Initialize the handler.
+        
+        Args:
+            *args: Positional arguments for RotatingFileHandler
+            flush_interval: Seconds between background flushes (0 flushes every record)
+            **kwargs: Keyword arguments for RotatingFileHandler
+        """
+        # Set before the base class opens the stream
+        self.flush_interval = flush_interval
+        super().__init__(*args, **kwargs)
+        
+        self._flush_stop = threading.Event()
+        self._flusher: Optional[threading.Thread] = None
+        if flush_interval > 0:
+            self._flusher = threading.Thread(
+                target=self._flush_periodically, name='log-flusher', daemon=True
+            )
+            self._flusher.start()
+    
+    def _open(self):
+        if self.flush_interval > 0:
+            return open(self.baseFilename, 'ab', buffering=_WRITE_BUFFER_SIZE)
+        return open(self.baseFilename, 'ab')
+    
+    def _flush_periodically(self) -> None:
+        """Flush buffered records until the handler is closed."""
+        while not self._flush_stop.wait(self.flush_interval):
+            self.flush()
+    
+    def emit(self, record: logging.LogRecord) -> None:
+        """
+        Write a record, rolling the file over first if it would grow too large.
+        
+        Args:
+            record: Log record to write
+        """
+        try:
+            formatter = self.formatter
+            if formatter is not None and hasattr(formatter, 'format_bytes'):
+                data = formatter.format_bytes(record)
+            else:
+                data = self.format(record).encode('utf-8')
+            data += b'\n'
+            
+            if self.stream is None:
+                self.stream = self._open()
+            
+            if self.maxBytes > 0 and self.stream.tell() + len(data) >= self.maxBytes:
+                self.doRollover()
+                if self.stream is None:
+                    self.stream = self._open()
+            
+            self.stream.write(data)
+            if self._flusher is None or record.levelno >= logging.ERROR:
+                self.stream.flush()
+        except RecursionError:
+            raise
+        except Exception:
+            self.handleError(record)
+    
+    def close(self) -> None:
+        """Stop the background flusher, then flush and close the file."""
+        self._flush_stop.set()
+        if self._flusher is not None:
+            self._flusher.join()
+        super().close()
 
 
 class PerformanceLogger:
@@ -118,7 +286,8 @@ class PerformanceLogger:
             logger: Base logger to use for output
         """
         self.logger = logger
-        self._timers: Dict[str, float] = {}
+        # Start times in perf_counter_ns() nanoseconds
+        self._timers: Dict[str, int] = {}
         self._lock = threading.RLock()
     
     @contextmanager
@@ -130,12 +299,12 @@ class PerformanceLogger:
             operation_name: Name of the operation being timed
             **extra_data: Additional data to include in log
         """
-        start_time = time.time()
+        start_ns = time.perf_counter_ns()
         
         try:
             yield
         finally:
-            execution_time = time.time() - start_time
+            execution_time = (time.perf_counter_ns() - start_ns) / 1e9
             self.log_timing(operation_name, execution_time, **extra_data)
     
     def start_timer(self, timer_name: str) -> None:
@@ -146,7 +315,7 @@ class PerformanceLogger:
             timer_name: Name of the timer
         """
         with self._lock:
-            self._timers[timer_name] = time.time()
+            self._timers[timer_name] = time.perf_counter_ns()
     
     def stop_timer(self, timer_name: str, **extra_data) -> float:
         """
@@ -164,8 +333,8 @@ class PerformanceLogger:
                 self.logger.warning(f"Timer {timer_name} was not started")
                 return 0.0
             
-            start_time = self._timers.pop(timer_name)
-            execution_time = time.time() - start_time
+            start_ns = self._timers.pop(timer_name)
+            execution_time = (time.perf_counter_ns() - start_ns) / 1e9
             
             self.log_timing(timer_name, execution_time, **extra_data)
             return execution_time
@@ -179,6 +348,10 @@ class PerformanceLogger:
             execution_time: Execution time in seconds
             **extra_data: Additional data to include
         """
+        # Skip message formatting and the extra dict when INFO is filtered out
+        if not self.logger.isEnabledFor(logging.INFO):
+            return
+        
         self.logger.info(
             f"Performance: {operation_name} completed in {execution_time:.3f}s",
             extra={
@@ -196,13 +369,18 @@ class StructuredLogger(ILogger):
     
     Provides structured logging with performance monitoring,
     context management, and flexible output formats.
+    
+    Context data is kept per thread by default, so set_context() and
+    context() only affect records logged from the calling thread. Pass
+    shared_context=True to share one lock-guarded context across threads.
     """
     
     def __init__(
         self,
         name: str,
         config: Optional[LoggingConfig] = None,
-        structured: bool = True
+        structured: bool = True,
+        shared_context: bool = False
     ):
         """
         Initialize the structured logger.
@@ -211,14 +389,16 @@ class StructuredLogger(ILogger):
             name: Logger name
             config: Logging configuration
             structured: Whether to use structured logging format
+            shared_context: Whether context data is shared by all threads
         """
         self.name = name
         self.config = config or LoggingConfig()
         self.structured = structured
+        self.shared_context = shared_context
         
         # Create base logger
         self._logger = logging.getLogger(name)
-        self._logger.setLevel(getattr(logging, self.config.level.value))
+        self._logger.setLevel(_LEVEL_MAP[self.config.level])
         
         # Clear existing handlers
         self._logger.handlers.clear()
@@ -229,21 +409,23 @@ class StructuredLogger(ILogger):
         # Create performance logger
         self.performance = PerformanceLogger(self._logger)
         
-        # Context storage
+        # Context storage: a locked dict when shared, else a per-thread stack
         self._context: Dict[str, Any] = {}
         self._context_lock = threading.RLock()
+        self._local = threading.local()
     
     def _setup_handlers(self) -> None:
         """Setup log handlers based on configuration."""
+        # One formatter for all handlers; structured loggers share a module-wide one
+        if self.structured:
+            formatter = _STRUCTURED_FORMATTER
+        else:
+            formatter = logging.Formatter(self.config.format)
+        
         # Console handler
         if self.config.console_output:
             console_handler = logging.StreamHandler()
-            
-            if self.structured:
-                console_handler.setFormatter(StructuredFormatter())
-            else:
-                console_handler.setFormatter(logging.Formatter(self.config.format))
-            
+            console_handler.setFormatter(formatter)
             self._logger.addHandler(console_handler)
         
         # File handler
@@ -251,21 +433,47 @@ class StructuredLogger(ILogger):
             # Ensure directory exists
             self.config.file_path.parent.mkdir(parents=True, exist_ok=True)
             
-            # Use rotating file handler
-            file_handler = logging.handlers.RotatingFileHandler(
+            # Use rotating file handler; records are written as UTF-8 bytes
+            file_handler = BytesRotatingFileHandler(
                 filename=self.config.file_path,
                 maxBytes=self.config.max_file_size,
                 backupCount=self.config.backup_count,
-                encoding='utf-8'
+                encoding='utf-8',
+                flush_interval=self.config.flush_interval
             )
-            
-            if self.structured:
-                file_handler.setFormatter(StructuredFormatter())
-            else:
-                file_handler.setFormatter(logging.Formatter(self.config.format))
-            
+            file_handler.setFormatter(formatter)
             self._logger.addHandler(file_handler)
     
+    def _context_stack(self) -> List[Tuple[Dict[str, Any], bool]]:
+        """
+        Return the calling thread's context stack, creating it on first use.
+        
+        Each entry is a (layer, inherits) pair. Layers hold only the data
+        set in their own scope; a layer that inherits also sees the
+        layers below it, up to the nearest one that does not.
+        """
+        try:
+            return self._local.stack
+        except AttributeError:
+            stack = self._local.stack = [({}, False)]
+            return stack
+    
+    def _thread_context(self) -> Dict[str, Any]:
+        """Return the context visible to the calling thread."""
+        stack = self._context_stack()
+        top = len(stack) - 1
+        start = top
+        while stack[start][1]:
+            start -= 1
+        
+        if start == top:
+            return stack[top][0]
+        
+        merged: Dict[str, Any] = {}
+        for layer, _ in stack[start:]:
+            merged.update(layer)
+        return merged
+    
     def set_context(self, **context_data) -> None:
         """
         Set context data that will be included in all log entries.
@@ -273,11 +481,20 @@ class StructuredLogger(ILogger):
         Args:
             **context_data: Context data to set
         """
+        if not self.shared_context:
+            self._context_stack()[-1][0].update(context_data)
+            return
+        
         with self._context_lock:
             self._context.update(context_data)
     
     def clear_context(self) -> None:
         """Clear all context data."""
+        if not self.shared_context:
+            # Hide outer scopes too; they come back when this scope exits
+            self._context_stack()[-1] = ({}, False)
+            return
+        
         with self._context_lock:
             self._context.clear()
     
@@ -289,6 +506,16 @@ class StructuredLogger(ILogger):
         Args:
             **context_data: Temporary context data
         """
+        if not self.shared_context:
+            # Push only this scope's data; popping it restores the outer context
+            stack = self._context_stack()
+            stack.append((context_data, True))
+            try:
+                yield
+            finally:
+                stack.pop()
+            return
+        
         # Save current context
         with self._context_lock:
             old_context = self._context.copy()
@@ -310,34 +537,160 @@ class StructuredLogger(ILogger):
             message: Message to log
             **kwargs: Additional context data
         """
-        # Combine context and kwargs
-        with self._context_lock:
-            extra_data = {**self._context, **kwargs}
+        self._log(_LEVEL_MAP[level], message, kwargs)
+    
+    def _log(self, log_level: int, message: str, kwargs: Dict[str, Any]) -> None:
+        """Emit a record at a standard library level."""
+        # Skip the context merge entirely for filtered-out levels
+        if not self._logger.isEnabledFor(log_level):
+            return
         
-        # Map LogLevel to logging level
-        log_level = getattr(logging, level.value)
+        # Combine context and kwargs, merging only when both have data
+        if self.shared_context:
+            with self._context_lock:
+                extra_data = {**self._context, **kwargs} if self._context else kwargs
+        else:
+            context = self._thread_context()
+            if not context:
+                extra_data = kwargs
+            elif not kwargs:
+                # Only this thread mutates its context and makeRecord just reads extra
+                extra_data = context
+            else:
+                extra_data = {**context, **kwargs}
         
-        self._logger.log(log_level, message, extra=extra_data)
+        self._logger.log(log_level, message, extra=extra_data or None)
+    
+    def close(self) -> None:
+        """Close and detach all handlers."""
+        for handler in self._logger.handlers:
+            handler.close()
+        self._logger.handlers.clear()
+    
+    def _with_config(self, config: LoggingConfig) -> 'StructuredLogger':
+        """Create a logger like this one that uses a different configuration."""
+        return type(self)(self.name, config, self.structured, self.shared_context)
     
     def debug(self, message: str, **kwargs) -> None:
         """Log debug message."""
-        self.log(LogLevel.DEBUG, message, **kwargs)
+        self._log(logging.DEBUG, message, kwargs)
     
     def info(self, message: str, **kwargs) -> None:
         """Log info message."""
-        self.log(LogLevel.INFO, message, **kwargs)
+        self._log(logging.INFO, message, kwargs)
     
     def warning(self, message: str, **kwargs) -> None:
         """Log warning message."""
-        self.log(LogLevel.WARNING, message, **kwargs)
+        self._log(logging.WARNING, message, kwargs)
     
     def error(self, message: str, **kwargs) -> None:
         """Log error message."""
-        self.log(LogLevel.ERROR, message, **kwargs)
+        self._log(logging.ERROR, message, kwargs)
     
     def critical(self, message: str, **kwargs) -> None:
         """Log critical message."""
-        self.log(LogLevel.CRITICAL, message, **kwargs)
+        self._log(logging.CRITICAL, message, kwargs)
+
+
+class _NonBlockingQueueHandler(logging.handlers.QueueHandler):
+    """Queue handler that defers formatting and drops records when full."""
+    
+    def __init__(self, record_queue: queue.Queue):
+        super().__init__(record_queue)
+        self.dropped = 0
+    
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        # Merge the arguments now, so later changes to mutable args do not
+        # show up in the log; formatting and encoding run on the listener
+        # thread. No 'message' attribute is set, as it would become extra data.
+        if record.args:
+            record = copy.copy(record)
+            record.msg = record.getMessage()
+            record.args = None
+        return record
+    
+    def enqueue(self, record: logging.LogRecord) -> None:
+        try:
+            self.queue.put_nowait(record)
+        except queue.Full:
+            self.dropped += 1
+
+
+class _QueueListener(logging.handlers.QueueListener):
+    """Queue listener whose stop() waits for room in a full queue."""
+    
+    def enqueue_sentinel(self) -> None:
+        self.queue.put(self._sentinel)
+
+
+class AsyncStructuredLogger(StructuredLogger):
+    """
+    Structured logger that hands records to a background thread.
+    
+    Logging calls only enqueue the record; message formatting, JSON
+    encoding and handler I/O run on a QueueListener thread. When the
+    queue is full new records are dropped (see dropped_records) instead
+    of blocking the caller. Call close() to flush pending records.
+    """
+    
+    def __init__(
+        self,
+        name: str,
+        config: Optional[LoggingConfig] = None,
+        structured: bool = True,
+        shared_context: bool = False,
+        queue_size: int = 10000
+    ):
+        """
+        Initialize the asynchronous structured logger.
+        
+        Args:
+            name: Logger name
+            config: Logging configuration
+            structured: Whether to use structured logging format
+            shared_context: Whether context data is shared by all threads
+            queue_size: Maximum number of records waiting to be written
+        """
+        self.queue_size = queue_size
+        super().__init__(name, config, structured, shared_context)
+    
+    def _setup_handlers(self) -> None:
+        """Move the configured handlers behind a queue and start the listener."""
+        super()._setup_handlers()
+        
+        targets = list(self._logger.handlers)
+        self._logger.handlers.clear()
+        
+        record_queue: queue.Queue = queue.Queue(self.queue_size)
+        self._queue_handler = _NonBlockingQueueHandler(record_queue)
+        self._logger.addHandler(self._queue_handler)
+        
+        self._listener = _QueueListener(
+            record_queue, *targets, respect_handler_level=True
+        )
+        self._listener.start()
+    
+    @property
+    def dropped_records(self) -> int:
+        """Number of records dropped because the queue was full."""
+        return self._queue_handler.dropped
+    
+    def close(self) -> None:
+        """Write out queued records, then close all handlers; safe to call twice."""
+        listener, self._listener = self._listener, None
+        if listener is None:
+            return
+        
+        listener.stop()
+        for handler in listener.handlers:
+            handler.close()
+        super().close()
+    
+    def _with_config(self, config: LoggingConfig) -> 'AsyncStructuredLogger':
+        """Create a logger like this one that uses a different configuration."""
+        return type(self)(
+            self.name, config, self.structured, self.shared_context, self.queue_size
+        )
 
 
 class LoggingManager:
@@ -363,7 +716,8 @@ class LoggingManager:
         self,
         name: str,
         config: Optional[LoggingConfig] = None,
-        structured: bool = True
+        structured: bool = True,
+        shared_context: bool = False
     ) -> StructuredLogger:
         """
         Get or create a logger instance.
@@ -372,14 +726,22 @@ class LoggingManager:
             name: Logger name
             config: Optional logger-specific configuration
             structured: Whether to use structured logging
+            shared_context: Whether context data is shared by all threads
             
         Returns:
             Logger instance
         """
+        # Existing loggers are returned without locking; dict.get is atomic
+        logger = self._loggers.get(name)
+        if logger is not None:
+            return logger
+        
         with self._lock:
             if name not in self._loggers:
                 logger_config = config or self.config
-                self._loggers[name] = StructuredLogger(name, logger_config, structured)
+                self._loggers[name] = StructuredLogger(
+                    name, logger_config, structured, shared_context
+                )
             
             return self._loggers[name]
     
@@ -395,16 +757,15 @@ class LoggingManager:
             
             # Recreate all loggers with new configuration
             for name in list(self._loggers.keys()):
-                structured = self._loggers[name].structured
-                self._loggers[name] = StructuredLogger(name, config, structured)
+                old_logger = self._loggers[name]
+                old_logger.close()
+                self._loggers[name] = old_logger._with_config(config)
     
     def shutdown(self) -> None:
         """Shutdown all loggers and handlers."""
         with self._lock:
             for logger in self._loggers.values():
-                for handler in logger._logger.handlers:
-                    handler.close()
-                logger._logger.handlers.clear()
+                logger.close()
             
             self._loggers.clear()
 
@@ -426,7 +787,8 @@ def setup_logging(config: LoggingConfig) -> None:
 def get_logger(
     name: str,
     config: Optional[LoggingConfig] = None,
-    structured: bool = True
+    structured: bool = True,
+    shared_context: bool = False
 ) -> StructuredLogger:
     """
     Get a logger instance.
@@ -435,11 +797,12 @@ def get_logger(
         name: Logger name
         config: Optional logger-specific configuration
         structured: Whether to use structured logging
+        shared_context: Whether context data is shared by all threads
         
     Returns:
         Logger instance
     """
-    return _logging_manager.get_logger(name, config, structured)
+    return _logging_manager.get_logger(name, config, structured, shared_context)
 
 
 def shutdown_logging() -> None:
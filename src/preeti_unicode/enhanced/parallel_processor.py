@@ -5,9 +5,13 @@ This module provides parallel processing utilities for handling
 large-scale conversion operations efficiently.
 """
 
+import multiprocessing
+import os
+import sys
 import time
 import threading
-from typing import Any, Dict, List, Optional, Callable, TypeVar, Generic, Union
+from functools import partial
+from typing import Any, Dict, List, Optional, Callable, Tuple, TypeVar, Generic, Union
 from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor, as_completed, Future
 from dataclasses import dataclass
 from enum import Enum
@@ -20,6 +24,15 @@ from preeti_unicode.core.exceptions import ProcessingTimeoutError, PreetiUnicode
 T = TypeVar('T')
 R = TypeVar('R')
 
+# Slotted dataclasses need Python 3.10+; older versions keep a __dict__
+_DATACLASS_OPTIONS: Dict[str, Any] = {'slots': True} if sys.version_info >= (3, 10) else {}
+
+# Task time each chunk should take once _process_chunked has adapted its size
+_TARGET_CHUNK_SECONDS = 0.1
+
+# Whether the thread worker GIL note has been logged in this process
+_gil_note_logged = False
+
 
 class TaskStatus(Enum):
     """Status enumeration for individual tasks."""
@@ -30,7 +43,7 @@ class TaskStatus(Enum):
     CANCELLED = "cancelled"
 
 
-@dataclass
+@dataclass(**_DATACLASS_OPTIONS)
 class TaskResult(Generic[R]):
     """Result of a parallel task execution."""
     task_id: str
@@ -52,37 +65,176 @@ class TaskResult(Generic[R]):
         return self.status == TaskStatus.COMPLETED and self.error is None
 
 
+def _available_cpus() -> int:
+    """Return the number of CPUs this process may run on."""
+    try:
+        # Honors taskset/cgroup CPU restrictions (Linux only)
+        return len(os.sched_getaffinity(0))
+    except AttributeError:
+        return os.cpu_count() or 1
+
+
+def _resolve_max_workers(max_workers: Optional[int]) -> int:
+    """
+    Default max_workers to the available CPUs and validate explicit values.
+    
+    Raises:
+        ValueError: If max_workers is less than 1
+    """
+    if max_workers is None:
+        return _available_cpus()
+    if max_workers < 1:
+        raise ValueError(f"max_workers must be at least 1, got {max_workers}")
+    return max_workers
+
+
+def _gil_enabled() -> bool:
+    """Return whether the interpreter runs with the GIL (always before 3.13)."""
+    is_gil_enabled = getattr(sys, '_is_gil_enabled', None)
+    return is_gil_enabled() if is_gil_enabled is not None else True
+
+
+def _log_gil_note_once(logger: logging.Logger) -> None:
+    """
+    Note, once per process, that thread workers serialize CPU-bound tasks.
+    
+    Logged at debug level, since most thread pools here run I/O-bound work.
+    """
+    global _gil_note_logged
+    if _gil_note_logged or not _gil_enabled():
+        return
+    
+    _gil_note_logged = True
+    logger.debug(
+        "Thread workers share the GIL, so CPU-bound tasks will not run in parallel; "
+        "use use_processes=True or pass nogil_worker=True if the task releases the GIL"
+    )
+
+
+def _pin_to_cpu(cpu_ids: Tuple[int, ...], worker_counter: Any) -> None:
+    """
+    Pin the calling worker process to one CPU from cpu_ids.
+    
+    Used as a process pool initializer; worker_counter is a shared
+    multiprocessing.Value that hands each worker the next CPU in turn.
+    """
+    with worker_counter.get_lock():
+        worker_index = worker_counter.value
+        worker_counter.value += 1
+    
+    os.sched_setaffinity(0, {cpu_ids[worker_index % len(cpu_ids)]})
+
+
+def _run_task(processor_func: Callable[[T], R], task_id: str, task: T) -> TaskResult[R]:
+    """
+    Run a single task and capture its result, error and timing.
+    
+    Defined at module level so it can be pickled for process pools.
+    """
+    start_ns = time.perf_counter_ns()
+    worker_id = threading.current_thread().name
+    
+    try:
+        result = processor_func(task)
+    except Exception as e:
+        return TaskResult(
+            task_id=task_id,
+            status=TaskStatus.FAILED,
+            input_data=task,
+            error=e,
+            execution_time=(time.perf_counter_ns() - start_ns) / 1e9,
+            worker_id=worker_id
+        )
+    
+    return TaskResult(
+        task_id=task_id,
+        status=TaskStatus.COMPLETED,
+        input_data=task,
+        output_data=result,
+        execution_time=(time.perf_counter_ns() - start_ns) / 1e9,
+        worker_id=worker_id
+    )
+
+
 class ParallelProcessor(Generic[T, R]):
     """
     Generic parallel processor for executing tasks concurrently.
     
     Provides flexible parallel processing with support for both
     thread-based and process-based execution.
+    
+    Tasks are submitted one by one by default and collected as they
+    complete. With submit_mode="map" they are dispatched through
+    executor.map in chunks, which cuts per-task IPC for process pools
+    with many small, similarly sized tasks; results then arrive in
+    input order.
+    
+    Thread pools only run Python code in parallel on free-threaded
+    interpreters. With the GIL enabled, CPU-bound processor functions
+    should use use_processes=True unless they release the GIL
+    themselves (I/O, C extensions); pass nogil_worker=True to declare
+    the latter.
     """
     
+    SUBMIT_MODES = ("submit", "map")
+    
     def __init__(
         self,
-        max_workers: int = 4,
+        max_workers: Optional[int] = None,
         use_processes: bool = False,
         timeout_seconds: Optional[float] = None,
         progress_tracker: Optional[IProgressTracker] = None,
-        logger: Optional[logging.Logger] = None
+        logger: Optional[logging.Logger] = None,
+        submit_mode: str = "submit",
+        cpu_affinity: Optional[List[int]] = None,
+        nogil_worker: bool = False
     ):
         """
         Initialize the parallel processor.
         
         Args:
             max_workers: Maximum number of worker threads/processes
+                (defaults to the number of CPUs available to this process)
             use_processes: Whether to use processes instead of threads
             timeout_seconds: Timeout for individual tasks
             progress_tracker: Optional progress tracker
             logger: Optional logger instance
+            submit_mode: "submit" for per-task futures, "map" for chunked executor.map
+            cpu_affinity: CPU ids to pin worker processes to, one CPU per
+                worker in turn (process pools on Linux only)
+            nogil_worker: Whether processor_func releases the GIL, so that
+                thread workers can run in parallel
+            
+        Raises:
+            ValueError: If max_workers is less than 1, submit_mode is not
+                supported or cpu_affinity names CPUs this process cannot run on
         """
-        self.max_workers = max_workers
+        if submit_mode not in self.SUBMIT_MODES:
+            raise ValueError(
+                f"Unsupported submit_mode: {submit_mode!r} (expected one of {self.SUBMIT_MODES})"
+            )
+        
+        self.max_workers = _resolve_max_workers(max_workers)
         self.use_processes = use_processes
         self.timeout_seconds = timeout_seconds
         self.progress_tracker = progress_tracker
         self.logger = logger or logging.getLogger(self.__class__.__name__)
+        self.submit_mode = submit_mode
+        self.cpu_affinity = cpu_affinity
+        self.nogil_worker = nogil_worker
+        
+        if not use_processes and not nogil_worker and self.max_workers > 1:
+            _log_gil_note_once(self.logger)
+        
+        if cpu_affinity and not (use_processes and hasattr(os, 'sched_setaffinity')):
+            self.logger.warning(
+                "cpu_affinity is only supported for process pools on Linux; ignoring it"
+            )
+            self.cpu_affinity = None
+        elif cpu_affinity:
+            unavailable = set(cpu_affinity) - os.sched_getaffinity(0)
+            if unavailable:
+                raise ValueError(f"CPUs not available to this process: {sorted(unavailable)}")
         
         self._executor_class = ProcessPoolExecutor if use_processes else ThreadPoolExecutor
         self._results: Dict[str, TaskResult[R]] = {}
@@ -130,6 +282,17 @@ class ParallelProcessor(Generic[T, R]):
             if self.progress_tracker:
                 self.progress_tracker.finish("Batch processing completed")
     
+    def _create_executor(self) -> Union[ThreadPoolExecutor, ProcessPoolExecutor]:
+        """Create the executor, pinning worker processes when cpu_affinity is set."""
+        if self.cpu_affinity:
+            return ProcessPoolExecutor(
+                max_workers=self.max_workers,
+                initializer=_pin_to_cpu,
+                initargs=(tuple(self.cpu_affinity), multiprocessing.Value('i', 0))
+            )
+        
+        return self._executor_class(max_workers=self.max_workers)
+    
     def _process_all(
         self,
         tasks: List[T],
@@ -137,13 +300,21 @@ class ParallelProcessor(Generic[T, R]):
         processor_func: Callable[[T], R]
     ) -> Dict[str, TaskResult[R]]:
         """Process all tasks in a single batch."""
+        if self.submit_mode == "map":
+            return self._process_mapped(tasks, task_ids, processor_func)
+        
         results = {}
         
-        with self._executor_class(max_workers=self.max_workers) as executor:
+        with self._create_executor() as executor:
             # Submit all tasks
             future_to_task = {}
             for task, task_id in zip(tasks, task_ids):
-                future = executor.submit(self._execute_task, task_id, task, processor_func)
+                if self.use_processes:
+                    # A bound method would pickle the processor and its lock,
+                    # so worker processes run the module-level task runner
+                    future = executor.submit(_run_task, processor_func, task_id, task)
+                else:
+                    future = executor.submit(self._execute_task, task_id, task, processor_func)
                 future_to_task[future] = (task_id, task)
             
             # Collect results
@@ -154,6 +325,8 @@ class ParallelProcessor(Generic[T, R]):
                 try:
                     result = future.result()
                     results[task_id] = result
+                    if self.use_processes and result.error is not None:
+                        self.logger.error(f"Task {task_id} failed: {result.error}")
                 except Exception as e:
                     self.logger.error(f"Task {task_id} failed: {e}")
                     results[task_id] = TaskResult(
@@ -169,6 +342,35 @@ class ParallelProcessor(Generic[T, R]):
         
         return results
     
+    def _process_mapped(
+        self,
+        tasks: List[T],
+        task_ids: List[str],
+        processor_func: Callable[[T], R]
+    ) -> Dict[str, TaskResult[R]]:
+        """Process all tasks through executor.map with an automatic chunksize."""
+        results = {}
+        chunksize = max(1, len(tasks) // (self.max_workers * 4))
+        
+        with self._create_executor() as executor:
+            mapped = executor.map(
+                partial(_run_task, processor_func),
+                task_ids,
+                tasks,
+                timeout=self.timeout_seconds,
+                chunksize=chunksize
+            )
+            
+            for completed_count, result in enumerate(mapped, 1):
+                results[result.task_id] = result
+                if result.error is not None:
+                    self.logger.error(f"Task {result.task_id} failed: {result.error}")
+                
+                if self.progress_tracker:
+                    self.progress_tracker.update(completed_count, f"Completed {result.task_id}")
+        
+        return results
+    
     def _process_chunked(
         self,
         tasks: List[T],
@@ -176,59 +378,82 @@ class ParallelProcessor(Generic[T, R]):
         processor_func: Callable[[T], R],
         chunk_size: int
     ) -> Dict[str, TaskResult[R]]:
-        """Process tasks in chunks."""
+        """
+        Process tasks in chunks.
+        
+        The first chunk uses chunk_size; later chunks are resized so that
+        each takes roughly _TARGET_CHUNK_SECONDS of task time, but never
+        below the requested size (so slow tasks keep every worker busy) or
+        above four times it.
+        """
         results = {}
         total_tasks = len(tasks)
+        start = 0
+        chunk_number = 0
+        min_chunk_size = chunk_size
+        max_chunk_size = chunk_size * 4
         
         # Process in chunks
-        for i in range(0, total_tasks, chunk_size):
-            chunk_tasks = tasks[i:i + chunk_size]
-            chunk_ids = task_ids[i:i + chunk_size]
+        while start < total_tasks:
+            end = start + chunk_size
+            chunk_tasks = tasks[start:end]
+            chunk_ids = task_ids[start:end]
+            chunk_number += 1
             
-            self.logger.debug(f"Processing chunk {i//chunk_size + 1}: {len(chunk_tasks)} tasks")
+            self.logger.debug(f"Processing chunk {chunk_number}: {len(chunk_tasks)} tasks")
             
             chunk_results = self._process_all(chunk_tasks, chunk_ids, processor_func)
             results.update(chunk_results)
+            start = end
+            
+            if chunk_number == 1 and chunk_results:
+                # Size the remaining chunks from the measured per-task time
+                total_time = sum(r.execution_time for r in chunk_results.values())
+                avg_time = total_time / len(chunk_results)
+                if avg_time > 0:
+                    target_size = int(_TARGET_CHUNK_SECONDS / avg_time)
+                    chunk_size = min(max_chunk_size, max(min_chunk_size, target_size))
+                else:
+                    chunk_size = max_chunk_size
+                
+                self.logger.debug(
+                    f"Adjusted chunk size to {chunk_size} (avg task time {avg_time:.6f}s)"
+                )
         
         return results
     
     def _execute_task(self, task_id: str, task: T, processor_func: Callable[[T], R]) -> TaskResult[R]:
         """Execute a single task with error handling and timing."""
-        start_time = time.time()
-        worker_id = threading.current_thread().name
+        self.logger.debug(f"Starting task {task_id} on worker {threading.current_thread().name}")
         
-        try:
-            self.logger.debug(f"Starting task {task_id} on worker {worker_id}")
-            
-            # Execute the task
-            result = processor_func(task)
-            
-            execution_time = time.time() - start_time
-            
-            self.logger.debug(f"Task {task_id} completed in {execution_time:.3f}s")
-            
-            return TaskResult(
-                task_id=task_id,
-                status=TaskStatus.COMPLETED,
-                input_data=task,
-                output_data=result,
-                execution_time=execution_time,
-                worker_id=worker_id
-            )
-            
-        except Exception as e:
-            execution_time = time.time() - start_time
-            
-            self.logger.error(f"Task {task_id} failed after {execution_time:.3f}s: {e}")
-            
-            return TaskResult(
-                task_id=task_id,
-                status=TaskStatus.FAILED,
-                input_data=task,
-                error=e,
-                execution_time=execution_time,
-                worker_id=worker_id
+        result = _run_task(processor_func, task_id, task)
+        
+        if result.error is None:
+            self.logger.debug(f"Task {task_id} completed in {result.execution_time:.3f}s")
+        else:
+            self.logger.error(
+                f"Task {task_id} failed after {result.execution_time:.3f}s: {result.error}"
             )
+        
+        return result
+
+
+def _convert_file(
+    converter_func: Callable[[Path, Path], bool],
+    io_pair: Tuple[Path, Path]
+) -> bool:
+    """
+    Run converter_func on an (input_path, output_path) pair.
+    
+    Module-level so that, bound with functools.partial, it can be pickled
+    for process pools.
+    """
+    return converter_func(*io_pair)
+
+
+def _file_task_id(io_pair: Tuple[Path, Path]) -> str:
+    """Use the input file path as the task ID."""
+    return str(io_pair[0])
 
 
 class BatchProcessor:
@@ -241,7 +466,7 @@ class BatchProcessor:
     
     def __init__(
         self,
-        max_workers: int = 4,
+        max_workers: Optional[int] = None,
         progress_tracker: Optional[IProgressTracker] = None,
         logger: Optional[logging.Logger] = None
     ):
@@ -250,17 +475,23 @@ class BatchProcessor:
         
         Args:
             max_workers: Maximum number of worker threads
+                (defaults to the number of CPUs available to this process)
             progress_tracker: Optional progress tracker
             logger: Optional logger instance
+            
+        Raises:
+            ValueError: If max_workers is less than 1
         """
-        self.max_workers = max_workers
+        self.max_workers = _resolve_max_workers(max_workers)
         self.progress_tracker = progress_tracker
         self.logger = logger or logging.getLogger(self.__class__.__name__)
         
-        self.processor = ParallelProcessor[Path, bool](
-            max_workers=max_workers,
+        # File conversion spends most of its time in I/O, which releases the GIL
+        self.processor = ParallelProcessor[Tuple[Path, Path], bool](
+            max_workers=self.max_workers,
             progress_tracker=progress_tracker,
-            logger=logger
+            logger=logger,
+            nogil_worker=True
         )
     
     def process_files(
@@ -285,20 +516,17 @@ class BatchProcessor:
         # Ensure output directory exists
         output_dir.mkdir(parents=True, exist_ok=True)
         
-        # Create processor function
-        def process_file(input_file: Path) -> bool:
-            output_file = output_dir / f"{input_file.stem}{output_extension}"
-            return converter_func(input_file, output_file)
-        
-        # Generate task IDs from file paths
-        def get_task_id(file_path: Path) -> str:
-            return str(file_path)
+        # Resolve every output path up front
+        io_pairs = [
+            (input_file, output_dir / f"{input_file.stem}{output_extension}")
+            for input_file in input_files
+        ]
         
         # Process files
         results = self.processor.process_batch(
-            tasks=input_files,
-            processor_func=process_file,
-            task_id_func=get_task_id
+            tasks=io_pairs,
+            processor_func=partial(_convert_file, converter_func),
+            task_id_func=_file_task_id
         )
         
         # Convert results to simple success mapping
@@ -319,11 +547,20 @@ class BatchProcessor:
             Dictionary containing statistics
         """
         total_tasks = len(results)
-        successful_tasks = sum(1 for r in results.values() if r.success)
-        failed_tasks = total_tasks - successful_tasks
+        successful_tasks = 0
+        timed_tasks = 0
+        total_execution_time = 0
         
-        execution_times = [r.execution_time for r in results.values() if r.execution_time > 0]
-        avg_execution_time = sum(execution_times) / len(execution_times) if execution_times else 0
+        # Single pass over the results
+        for r in results.values():
+            if r.success:
+                successful_tasks += 1
+            if r.execution_time > 0:
+                timed_tasks += 1
+                total_execution_time += r.execution_time
+        
+        failed_tasks = total_tasks - successful_tasks
+        avg_execution_time = total_execution_time / timed_tasks if timed_tasks else 0
         
         return {
             'total_tasks': total_tasks,
@@ -331,7 +568,7 @@ class BatchProcessor:
             'failed_tasks': failed_tasks,
             'success_rate': successful_tasks / total_tasks if total_tasks > 0 else 0,
             'average_execution_time': avg_execution_time,
-            'total_execution_time': sum(execution_times)
+            'total_execution_time': total_execution_time
         }
 
 
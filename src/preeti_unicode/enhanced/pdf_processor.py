@@ -12,19 +12,191 @@ from typing import Any, Dict, List, Optional, Tuple, Callable
 from pathlib import Path
 import logging
 import time
-from concurrent.futures import ThreadPoolExecutor, as_completed
+from functools import lru_cache, partial
+from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor, as_completed
 
 try:
     import pymupdf as fitz
 except ImportError:
     fitz = None
 
+from preeti_unicode.converter import is_preeti_font
 from preeti_unicode.core.base_classes import BaseReader
 from preeti_unicode.core.interfaces import IProgressTracker, ProcessingStatus
 from preeti_unicode.core.exceptions import (
     FileProcessingError, ValidationError, DependencyError,
     ProcessingTimeoutError
 )
+from preeti_unicode.enhanced.parallel_processor import _available_cpus
+
+
+# Documents use a handful of distinct fonts, so font checks are memoized
+_is_preeti_font_cached = lru_cache(maxsize=256)(is_preeti_font)
+
+# Document opened once per worker process by _init_page_worker
+_worker_doc = None
+
+# Page blocks submitted per worker; more blocks balance load, fewer cut overhead
+_BLOCKS_PER_WORKER = 4
+
+
+def _get_max_workers(total_pages: int, max_workers: int) -> int:
+    """
+    Return the number of page workers to use.
+    
+    Args:
+        total_pages: Number of pages to process
+        max_workers: Configured upper bound
+        
+    Returns:
+        Smallest of the available CPUs, the page count and max_workers
+    """
+    return max(1, min(_available_cpus(), total_pages, max_workers))
+
+
+def _open_document(file_path: str, password: Optional[str] = None):
+    """Open a PDF document, authenticating it if a password is given."""
+    doc = fitz.open(file_path)
+    if doc.needs_pass and password:
+        doc.authenticate(password)
+    return doc
+
+
+def _init_page_worker(file_path: str, password: Optional[str]) -> None:
+    """Process pool initializer: open the document once for this worker."""
+    global _worker_doc
+    _worker_doc = _open_document(file_path, password)
+
+
+def _page_error_content(page_num: int, error: Exception) -> Dict[str, Any]:
+    """Build the placeholder content for a page that failed to process."""
+    return {
+        'text': '',
+        'page_number': page_num + 1,
+        'error': str(error),
+        'font_info': [],
+        'blocks': []
+    }
+
+
+def _page_text_blocks(page) -> List[str]:
+    """Return the non-empty text blocks of a page without span details."""
+    page_text = []
+    for block in page.get_text("blocks"):
+        # Entry 6 is the block type; 0 means text
+        if block[6] == 0:
+            block_text = "\n".join(line for line in block[4].split("\n") if line.strip())
+            if block_text.strip():
+                page_text.append(block_text.strip())
+    return page_text
+
+
+def _extract_page_content(doc, page_num: int, need_font_info: bool = True) -> Dict[str, Any]:
+    """
+    Extract content from a single PDF page.
+    
+    Args:
+        doc: PyMuPDF document object
+        page_num: Page number (0-based)
+        need_font_info: Whether to collect per-span font information; if
+            False, text is taken from MuPDF's block text, which is much
+            cheaper but separates spans with spaces as MuPDF does
+        
+    Returns:
+        Dictionary containing page content and metadata
+    """
+    page = doc.load_page(page_num)
+    
+    if not need_font_info:
+        page_text = _page_text_blocks(page)
+        return {
+            'text': "\n\n".join(page_text),
+            'page_number': page_num + 1,
+            'font_info': [],
+            'blocks': page_text,
+            'page_size': page.rect,
+            'rotation': page.rotation
+        }
+    
+    blocks = page.get_text("dict")
+    page_text = []
+    font_info = []
+    preeti_fonts: Dict[str, bool] = {}
+    
+    for block in blocks["blocks"]:
+        if "lines" in block:
+            block_text = ""
+            for line in block["lines"]:
+                line_text = ""
+                for span in line["spans"]:
+                    text = span["text"]
+                    font = span.get("font", "")
+                    
+                    if text.strip():
+                        line_text += text
+                        
+                        is_preeti = preeti_fonts.get(font)
+                        if is_preeti is None:
+                            is_preeti = preeti_fonts[font] = _is_preeti_font_cached(font)
+                        
+                        font_info.append({
+                            'text': text,
+                            'font': font,
+                            'is_preeti': is_preeti,
+                            'size': span.get('size', 0),
+                            'flags': span.get('flags', 0),
+                            'bbox': span.get('bbox', [])
+                        })
+                
+                if line_text.strip():
+                    block_text += line_text + "\n"
+            
+            if block_text.strip():
+                page_text.append(block_text.strip())
+    
+    return {
+        'text': "\n\n".join(page_text),
+        'page_number': page_num + 1,
+        'font_info': font_info,
+        'blocks': page_text,
+        'page_size': page.rect,
+        'rotation': page.rotation
+    }
+
+
+def _page_blocks(total_pages: int, max_workers: int) -> List[Tuple[int, int]]:
+    """Split the page range into contiguous (start, end) blocks for the workers."""
+    block_size = -(-total_pages // (max_workers * _BLOCKS_PER_WORKER))
+    return [
+        (start, min(start + block_size, total_pages))
+        for start in range(0, total_pages, block_size)
+    ]
+
+
+def _extract_page_block(
+    extract: Callable[[Any, int], Dict[str, Any]],
+    doc,
+    start: int,
+    end: int
+) -> List[Tuple[int, Dict[str, Any]]]:
+    """Extract pages start..end-1, capturing per-page errors."""
+    results = []
+    for page_num in range(start, end):
+        try:
+            results.append((page_num, extract(doc, page_num)))
+        except Exception as e:
+            results.append((page_num, _page_error_content(page_num, e)))
+    return results
+
+
+def _worker_extract_page_block(
+    start: int,
+    end: int,
+    need_font_info: bool = True
+) -> List[Tuple[int, Dict[str, Any]]]:
+    """Extract a block of pages from the worker process's document."""
+    extract = partial(_extract_page_content, need_font_info=need_font_info)
+    return _extract_page_block(extract, _worker_doc, start, end)
 
 
 class PDFIntegrityValidator:
@@ -218,6 +390,7 @@ class EnhancedPDFReader(BaseReader):
         parallel_processing = kwargs.get('parallel_processing', True)
         max_workers = kwargs.get('max_workers', 4)
         timeout_seconds = kwargs.get('timeout_seconds', 300.0)
+        need_font_info = kwargs.get('need_font_info', True)
         
         # Validate PDF integrity
         if validate_integrity:
@@ -263,9 +436,12 @@ class EnhancedPDFReader(BaseReader):
             
             # Process pages
             if parallel_processing and total_pages > 1:
-                pages = self._process_pages_parallel(doc, max_workers, timeout_seconds)
+                pages = self._process_pages_parallel(
+                    doc, max_workers, timeout_seconds, file_path=file_path, password=password,
+                    need_font_info=need_font_info
+                )
             else:
-                pages = self._process_pages_sequential(doc)
+                pages = self._process_pages_sequential(doc, need_font_info)
             
             # Extract document metadata
             metadata = {
@@ -310,12 +486,13 @@ class EnhancedPDFReader(BaseReader):
                 cause=e
             )
     
-    def _process_pages_sequential(self, doc) -> List[Dict[str, Any]]:
+    def _process_pages_sequential(self, doc, need_font_info: bool = True) -> List[Dict[str, Any]]:
         """
         Process PDF pages sequentially.
         
         Args:
             doc: PyMuPDF document object
+            need_font_info: Whether to collect per-span font information
             
         Returns:
             List of page content dictionaries
@@ -324,7 +501,7 @@ class EnhancedPDFReader(BaseReader):
         
         for page_num in range(len(doc)):
             try:
-                page_content = self._extract_page_content(doc, page_num)
+                page_content = self._extract_page_content(doc, page_num, need_font_info)
                 pages.append(page_content)
                 
                 if self.progress_tracker:
@@ -332,61 +509,79 @@ class EnhancedPDFReader(BaseReader):
                     
             except Exception as e:
                 self.logger.warning(f"Failed to process page {page_num}: {e}")
-                pages.append({
-                    'text': '',
-                    'page_number': page_num + 1,
-                    'error': str(e),
-                    'font_info': [],
-                    'blocks': []
-                })
+                pages.append(_page_error_content(page_num, e))
         
         return pages
     
-    def _process_pages_parallel(self, doc, max_workers: int, timeout_seconds: float) -> List[Dict[str, Any]]:
+    def _process_pages_parallel(
+        self,
+        doc,
+        max_workers: int,
+        timeout_seconds: float,
+        file_path: Optional[Path] = None,
+        password: Optional[str] = None,
+        need_font_info: bool = True
+    ) -> List[Dict[str, Any]]:
         """
         Process PDF pages in parallel.
         
+        Page extraction is CPU-bound and holds the GIL, so when the
+        document path is known and there are at least two pages per
+        worker, pages are extracted in worker processes that each open
+        the document once. Smaller documents use threads on the already
+        open document to avoid process startup cost.
+        
         Args:
             doc: PyMuPDF document object
-            max_workers: Maximum number of worker threads
+            max_workers: Maximum number of workers
             timeout_seconds: Timeout for parallel processing
+            file_path: Path of the document, required for worker processes
+            password: Password for the document, if protected
+            need_font_info: Whether to collect per-span font information
             
         Returns:
             List of page content dictionaries
         """
-        pages = [None] * len(doc)
+        total_pages = len(doc)
+        pages = [None] * total_pages
+        max_workers = _get_max_workers(total_pages, max_workers)
         
-        def process_page(page_num: int) -> Tuple[int, Dict[str, Any]]:
-            try:
-                page_content = self._extract_page_content(doc, page_num)
-                return page_num, page_content
-            except Exception as e:
-                self.logger.warning(f"Failed to process page {page_num}: {e}")
-                return page_num, {
-                    'text': '',
-                    'page_number': page_num + 1,
-                    'error': str(e),
-                    'font_info': [],
-                    'blocks': []
-                }
+        if file_path is not None and max_workers > 1 and total_pages >= 2 * max_workers:
+            executor = ProcessPoolExecutor(
+                max_workers=max_workers,
+                initializer=_init_page_worker,
+                initargs=(str(file_path), password)
+            )
+            process_block = partial(_worker_extract_page_block, need_font_info=need_font_info)
+        else:
+            executor = ThreadPoolExecutor(max_workers=max_workers)
+            extract = partial(self._extract_page_content, need_font_info=need_font_info)
+            process_block = partial(_extract_page_block, extract, doc)
         
         try:
-            with ThreadPoolExecutor(max_workers=max_workers) as executor:
-                # Submit all page processing tasks
-                future_to_page = {
-                    executor.submit(process_page, page_num): page_num
-                    for page_num in range(len(doc))
-                }
+            with executor:
+                # Submit contiguous blocks of pages rather than one task per page
+                futures = [
+                    executor.submit(process_block, start, end)
+                    for start, end in _page_blocks(total_pages, max_workers)
+                ]
                 
                 # Collect results with timeout
                 completed_count = 0
-                for future in as_completed(future_to_page, timeout=timeout_seconds):
-                    page_num, page_content = future.result()
-                    pages[page_num] = page_content
-                    completed_count += 1
+                for future in as_completed(futures, timeout=timeout_seconds):
+                    block_results = future.result()
+                    for page_num, page_content in block_results:
+                        if 'error' in page_content:
+                            self.logger.warning(
+                                f"Failed to process page {page_num}: {page_content['error']}"
+                            )
+                        pages[page_num] = page_content
+                    completed_count += len(block_results)
                     
                     if self.progress_tracker:
-                        self.progress_tracker.update(completed_count, f"Processed page {page_num + 1}")
+                        self.progress_tracker.update(
+                            completed_count, f"Processed {completed_count}/{total_pages} pages"
+                        )
                 
         except TimeoutError:
             raise ProcessingTimeoutError(
@@ -397,55 +592,21 @@ class EnhancedPDFReader(BaseReader):
         
         return pages
     
-    def _extract_page_content(self, doc, page_num: int) -> Dict[str, Any]:
+    def _extract_page_content(
+        self,
+        doc,
+        page_num: int,
+        need_font_info: bool = True
+    ) -> Dict[str, Any]:
         """
         Extract content from a single PDF page.
         
         Args:
             doc: PyMuPDF document object
             page_num: Page number (0-based)
+            need_font_info: Whether to collect per-span font information
             
         Returns:
             Dictionary containing page content and metadata
         """
-        from preeti_unicode.converter import is_preeti_font
-        
-        page = doc.load_page(page_num)
-        blocks = page.get_text("dict")
-        page_text = []
-        font_info = []
-        
-        for block in blocks["blocks"]:
-            if "lines" in block:
-                block_text = ""
-                for line in block["lines"]:
-                    line_text = ""
-                    for span in line["spans"]:
-                        text = span["text"]
-                        font = span.get("font", "")
-                        
-                        if text.strip():
-                            line_text += text
-                            font_info.append({
-                                'text': text,
-                                'font': font,
-                                'is_preeti': is_preeti_font(font),
-                                'size': span.get('size', 0),
-                                'flags': span.get('flags', 0),
-                                'bbox': span.get('bbox', [])
-                            })
-                    
-                    if line_text.strip():
-                        block_text += line_text + "\n"
-                
-                if block_text.strip():
-                    page_text.append(block_text.strip())
-        
-        return {
-            'text': "\n\n".join(page_text),
-            'page_number': page_num + 1,
-            'font_info': font_info,
-            'blocks': page_text,
-            'page_size': page.rect,
-            'rotation': page.rotation
-        }
+        return _extract_page_content(doc, page_num, need_font_info)
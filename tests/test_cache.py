@@ -0,0 +1,185 @@
+"""Tests for the caching system."""
+
+import time
+
+from preeti_unicode.enhanced.cache import (
+    CacheEntry,
+    CacheManager,
+    FileCache,
+    MemoryCache,
+    NoOpCache,
+)
+
+
+class TestCacheEntry:
+    """Test cases for CacheEntry."""
+
+    def test_expiry_uses_callers_clock(self):
+        """Expiry is measured on the clock the entry was stamped with."""
+        now = time.monotonic()
+        entry = CacheEntry(value="v", created_at=now, ttl=100)
+
+        assert not entry.is_expired(now)
+        assert not entry.is_expired(now + 100)
+        assert entry.is_expired(now + 101)
+        assert not CacheEntry(value="v", created_at=now).is_expired(now + 1e9)
+
+    def test_touch_records_access(self):
+        """touch stamps the given time and counts the access."""
+        entry = CacheEntry(value="v", created_at=10.0)
+
+        entry.touch(12.5)
+
+        assert entry.access_count == 1
+        assert entry.last_accessed == 12.5
+
+
+class TestMemoryCache:
+    """Test cases for MemoryCache."""
+
+    def test_fresh_entry_with_ttl_is_returned(self):
+        """Entries within their TTL are hits, and tracked access is monotonic."""
+        cache = MemoryCache(max_size=10, default_ttl=100, track_access=True)
+        cache.set("k", "v")
+
+        assert cache.get("k") == "v"
+        assert cache.cleanup_expired() == 0
+        entry = cache._cache["k"]
+        assert entry.access_count == 1
+        assert entry.created_at <= entry.last_accessed <= time.monotonic()
+
+    def test_expired_entry_is_dropped(self):
+        """Entries past their TTL are misses and are removed."""
+        cache = MemoryCache(max_size=10)
+        cache.set("k", "v", ttl=0.01)
+        time.sleep(0.02)
+
+        assert cache.get("k") is None
+        assert "k" not in cache._cache
+
+
+class TestBulkOperations:
+    """Test cases for get_many and set_many."""
+
+    def test_memory_cache_bulk_round_trip(self):
+        """set_many stores every item and get_many returns only hits."""
+        cache = MemoryCache(max_size=10)
+        cache.set_many({"a": 1, "b": 2, "c": 3})
+
+        assert cache.get_many(["a", "c", "missing"]) == {"a": 1, "c": 3}
+        stats = cache.get_stats()
+        assert stats["hits"] == 2
+        assert stats["misses"] == 1
+
+    def test_memory_cache_set_many_evicts_oldest(self):
+        """Bulk inserts respect max_size in LRU order."""
+        cache = MemoryCache(max_size=2)
+        cache.set_many({"a": 1, "b": 2, "c": 3})
+
+        assert cache.get_many(["a", "b", "c"]) == {"b": 2, "c": 3}
+
+    def test_memory_cache_get_many_shared_clock(self):
+        """Callers can pass one clock reading for a whole batch."""
+        cache = MemoryCache(max_size=10)
+        cache.set_many({"a": 1}, ttl=100)
+
+        assert cache.get_many(["a"], now=time.monotonic() + 50) == {"a": 1}
+        assert cache.get_many(["a"], now=time.monotonic() + 101) == {}
+
+    def test_file_cache_uses_interface_defaults(self, tmp_path):
+        """Caches without bulk overrides fall back to per-key calls."""
+        cache = FileCache(tmp_path)
+        cache.set_many({"a": 1, "b": 2})
+
+        assert cache.get_many(["a", "b", "missing"]) == {"a": 1, "b": 2}
+
+    def test_noop_cache(self):
+        """The disabled cache stores nothing."""
+        cache = NoOpCache()
+        cache.set_many({"a": 1})
+
+        assert cache.get_many(["a"]) == {}
+
+
+class TestFileCache:
+    """Test cases for FileCache."""
+
+    def test_entries_expire_on_wall_clock(self, tmp_path):
+        """File entries are stamped and checked with wall-clock time."""
+        cache = FileCache(tmp_path, max_size=10)
+        cache.set("fresh", "v", ttl=100)
+        cache.set("stale", "v", ttl=0.01)
+        time.sleep(0.02)
+
+        assert cache.get("fresh") == "v"
+        assert cache.get("stale") is None
+        assert len(list(tmp_path.iterdir())) == 1
+
+    def test_evicts_least_recently_used(self, tmp_path):
+        """Reads promote entries, so the least recently used file is evicted."""
+        cache = FileCache(tmp_path, max_size=2)
+        cache.set("a", 1)
+        cache.set("b", 2)
+        cache.get("a")
+        cache.set("c", 3)
+
+        assert cache.get("a") == 1
+        assert cache.get("b") is None
+        assert cache.get("c") == 3
+        assert len(list(tmp_path.glob("*.cache"))) == 2
+
+    def test_index_built_from_existing_files(self, tmp_path):
+        """A new cache on a populated directory indexes the existing files."""
+        first = FileCache(tmp_path)
+        first.set("a", 1)
+        first.set("b", 2)
+
+        second = FileCache(tmp_path, max_size=2)
+        second.set("c", 3)
+
+        assert len(list(tmp_path.glob("*.cache"))) == 2
+        assert second.get("c") == 3
+
+    def test_delete_and_clear(self, tmp_path):
+        """Deleted entries leave the index and clear removes every file."""
+        cache = FileCache(tmp_path, max_size=2)
+        cache.set("a", 1)
+        cache.set("b", 2)
+
+        assert cache.delete("a")
+        assert not cache.delete("a")
+        cache.set("c", 3)
+        assert cache.get("b") == 2
+
+        cache.clear()
+        assert list(tmp_path.glob("*.cache")) == []
+
+
+class TestCacheManager:
+    """Test cases for CacheManager."""
+
+    def test_disabled_default_short_circuits(self):
+        """With a disabled default, unnamed calls skip the cache entirely."""
+        manager = CacheManager()
+        manager.add_cache("off", NoOpCache())
+        manager.add_cache("mem", MemoryCache())
+
+        manager.set("k", "v")
+        assert manager.get("k") is None
+        assert not manager.delete("k")
+
+        manager.set("k", "v", cache_name="mem")
+        assert manager.get("k", cache_name="mem") == "v"
+        assert manager.delete("k", cache_name="mem")
+
+    def test_enabled_default_restores_dispatch(self):
+        """Switching the default to a real cache removes the fast path."""
+        manager = CacheManager()
+        manager.add_cache("off", NoOpCache())
+        manager.add_cache("mem", MemoryCache(), is_default=True)
+
+        manager.set("k", "v")
+
+        assert manager.get("k") == "v"
+        assert manager.get_cache().get("k") == "v"
+        assert "get" not in vars(manager)
@@ -0,0 +1,57 @@
+"""Tests for the command line interface."""
+
+import sys
+from concurrent.futures import ProcessPoolExecutor
+
+from preeti_unicode import cli
+
+
+def _run_cli(monkeypatch, *argv):
+    """Run the CLI entry point with the given arguments."""
+    monkeypatch.setattr(sys, "argv", ["preeti-unicode", *argv])
+    return cli.main()
+
+
+class TestBatchCommand:
+    """Test cases for the batch subcommand."""
+
+    def test_converts_files_in_a_process_pool(self, tmp_path, monkeypatch, capsys):
+        """Each input file is converted in a worker process."""
+        input_dir = tmp_path / "in"
+        input_dir.mkdir()
+        (input_dir / "a.txt").write_text("ljBfno", encoding="utf-8")
+        (input_dir / "b.txt").write_text("gd:sf/", encoding="utf-8")
+        output_dir = tmp_path / "out"
+
+        pools = []
+
+        class RecordingPool(ProcessPoolExecutor):
+            def __init__(self, max_workers=None):
+                pools.append(max_workers)
+                super().__init__(max_workers=max_workers)
+
+        monkeypatch.setattr(cli, "ProcessPoolExecutor", RecordingPool)
+        monkeypatch.setattr(cli.os, "cpu_count", lambda: 8)
+
+        exit_code = _run_cli(
+            monkeypatch, "batch", str(input_dir),
+            "--input-format", "txt", "--output-format", "txt",
+            "--output-dir", str(output_dir)
+        )
+
+        assert exit_code == 0
+        assert pools == [2]
+        assert (output_dir / "a.txt").read_text(encoding="utf-8").strip() == "विधालय"
+        assert (output_dir / "b.txt").read_text(encoding="utf-8").strip() == "नमस्कार"
+        assert "2/2 files successful" in capsys.readouterr().out
+
+    def test_no_input_files(self, tmp_path, monkeypatch, capsys):
+        """An empty input directory is reported as an error."""
+        exit_code = _run_cli(
+            monkeypatch, "batch", str(tmp_path),
+            "--input-format", "txt", "--output-format", "txt",
+            "--output-dir", str(tmp_path / "out")
+        )
+
+        assert exit_code == 1
+        assert "No input files found" in capsys.readouterr().err
@@ -0,0 +1,145 @@
+"""Tests for configuration loading and merging."""
+
+import json
+from pathlib import Path
+
+import pytest
+
+from preeti_unicode.core import config as config_module
+from preeti_unicode.core.config import (
+    Configuration,
+    LogLevel,
+    load_config,
+)
+from preeti_unicode.core.exceptions import ConfigurationError
+
+
+def _sample_config():
+    """Configuration with non-default values in every section."""
+    return Configuration.from_dict({
+        "logging": {"level": "WARNING", "file_path": "logs/app.log", "flush_interval": 0.5},
+        "cache": {"type": "file", "max_size": 12},
+        "processing": {"max_workers": 2, "timeout_seconds": 9.5},
+        "fonts": {"custom_mappings": {"a": "अ"}, "font_files": {"x": "fonts/x.ttf"}},
+        "plugins": {"spell": {"enabled": True}},
+        "middleware": [{"name": "trim"}],
+    })
+
+
+class TestConfigMerge:
+    """Test cases for merging configuration sources."""
+
+    def test_env_can_restore_default_values(self, tmp_path, monkeypatch):
+        """Env values equal to the defaults still override the file."""
+        config_file = tmp_path / "config.json"
+        config_file.write_text(json.dumps({
+            "logging": {"level": "DEBUG"},
+            "processing": {"max_workers": 8},
+        }))
+        monkeypatch.setenv("PREETI_LOG_LEVEL", "INFO")
+        monkeypatch.setenv("PREETI_MAX_WORKERS", "4")
+
+        config = load_config(config_file)
+
+        assert config.logging.level is LogLevel.INFO
+        assert config.processing.max_workers == 4
+
+    def test_file_values_kept_without_env(self, tmp_path, monkeypatch):
+        """Fields not set in the environment keep their file values."""
+        config_file = tmp_path / "config.json"
+        config_file.write_text(json.dumps({
+            "logging": {"level": "DEBUG", "backup_count": 2},
+            "processing": {"max_workers": 8},
+        }))
+        monkeypatch.delenv("PREETI_LOG_LEVEL", raising=False)
+        monkeypatch.setenv("PREETI_MAX_WORKERS", "3")
+
+        config = load_config(config_file)
+
+        assert config.logging.level is LogLevel.DEBUG
+        assert config.logging.backup_count == 2
+        assert config.processing.max_workers == 3
+
+    def test_merge_only_applies_present_keys(self):
+        """Merging leaves sections and fields absent from the data alone."""
+        base = Configuration.from_dict({"cache": {"max_size": 50}})
+
+        merged = base.merge({"cache": {"ttl_seconds": 10}})
+
+        assert merged.cache.max_size == 50
+        assert merged.cache.ttl_seconds == 10
+        assert merged.logging is base.logging
+        assert base.merge({}) is base
+
+    def test_merge_parses_only_overriding_keys(self, monkeypatch):
+        """Overrides are parsed from their dict form; other fields are reused."""
+        base = _sample_config()
+        monkeypatch.setattr(config_module.FontConfig, "from_dict", None)
+
+        merged = base.merge({
+            "logging": {"level": "ERROR"},
+            "fonts": {"default_font": "kantipur", "unknown": 1},
+        })
+
+        assert merged.logging.level is LogLevel.ERROR
+        assert merged.logging.file_path is base.logging.file_path
+        assert merged.fonts.default_font == "kantipur"
+        assert merged.fonts.font_files is base.fonts.font_files
+        assert merged.fonts.custom_mappings is base.fonts.custom_mappings
+
+    def test_invalid_env_values_are_ignored(self, monkeypatch):
+        """Unparseable environment values fall back to the defaults."""
+        monkeypatch.setenv("PREETI_LOG_LEVEL", "LOUD")
+        monkeypatch.setenv("PREETI_MAX_WORKERS", "many")
+
+        config = Configuration.load_from_env()
+
+        assert config.logging.level is LogLevel.INFO
+        assert config.processing.max_workers == 4
+
+
+class TestConfigFiles:
+    """Test cases for saving and loading configuration files."""
+
+    @pytest.mark.parametrize("encoder", ["json", "orjson"])
+    def test_json_round_trip(self, tmp_path, monkeypatch, encoder):
+        """JSON files load back equal with either encoder."""
+        if encoder == "orjson":
+            pytest.importorskip("orjson")
+        else:
+            monkeypatch.setattr(config_module, "orjson", None)
+        path = tmp_path / "config.json"
+        config = _sample_config()
+
+        config.save_to_file(path)
+        loaded = Configuration.load_from_file(path)
+
+        assert loaded == config
+        assert json.loads(path.read_text(encoding="utf-8")) == config.to_dict()
+
+    def test_unsupported_format(self, tmp_path):
+        """Unknown file suffixes raise ConfigurationError."""
+        path = tmp_path / "config.ini"
+        path.write_text("[logging]")
+
+        with pytest.raises(ConfigurationError):
+            Configuration.load_from_file(path)
+        with pytest.raises(ConfigurationError):
+            _sample_config().save_to_file(path)
+
+    def test_missing_file(self, tmp_path):
+        """Loading a missing file raises ConfigurationError."""
+        with pytest.raises(ConfigurationError):
+            Configuration.load_from_file(tmp_path / "missing.json")
+
+    def test_yaml_round_trip(self, tmp_path):
+        """YAML files load back to an equal configuration."""
+        path = tmp_path / "config.yaml"
+        config = _sample_config()
+
+        config.save_to_file(path)
+        loaded = Configuration.load_from_file(path)
+
+        assert loaded == config
+        assert loaded.logging.file_path == Path("logs/app.log")
+        assert "अ" in path.read_text(encoding="utf-8")
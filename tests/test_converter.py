@@ -1,7 +1,7 @@
 """Basic tests for the preeti unicode converter."""
 
 import pytest
-from preeti_unicode.converter import PreetiUnicodeConverter
+from preeti_unicode.converter import PreetiUnicodeConverter, convert_text, is_preeti_font
 
 
 class TestPreetiUnicodeConverter:
@@ -36,3 +36,61 @@ class TestPreetiUnicodeConverter:
         converter = PreetiUnicodeConverter()
         with pytest.raises((TypeError, ValueError)):
             converter.convert(None)
+
+    def test_convert_to_unicode(self):
+        """Test Preeti to Unicode character mapping."""
+        converter = PreetiUnicodeConverter()
+        assert converter.convert_to_unicode("g]kfn") == "नेपाल"
+        assert converter.convert_to_unicode("@)!&") == "२०१७"
+        assert converter.convert_to_unicode("") == ""
+
+    def test_convert_numbers_to_nepali(self):
+        """Test English to Nepali numeral conversion."""
+        converter = PreetiUnicodeConverter()
+        assert converter.convert_numbers_to_nepali("abc 2024") == "abc २०२४"
+        assert converter.convert_numbers_to_nepali("") == ""
+
+    def test_normalize_preeti(self):
+        """Test combination replacement and reph/'l' reordering."""
+        converter = PreetiUnicodeConverter()
+        assert converter.normalize_preeti("ljBfno") == "jlBfno"
+        assert converter.normalize_preeti("sd{") == "s{d"
+        assert converter.normalize_preeti("qmd") == "s|d"
+        assert converter.normalize_preeti("kmf]g") == "फोg"
+        assert converter.normalize_preeti("") == ""
+
+
+class TestConvertText:
+    """Test cases for the convert_text module function."""
+
+    def test_words(self):
+        """Test conversion of common words."""
+        assert convert_text("ljBfno") == "विधालय"
+        assert convert_text("gd:sf/") == "नमस्कार"
+        assert convert_text("sd{") == "कर्म"
+        assert convert_text("cfdf") == "आमा"
+        assert convert_text("Iff]q") == "क्षोत्र"
+
+    def test_digits_map_to_preeti_glyphs(self):
+        """ASCII digits are Preeti glyphs, with or without number conversion."""
+        assert convert_text("2024") == "द्दण्द्दद्ध"
+        assert convert_text("2024", convert_numbers=False) == "द्दण्द्दद्ध"
+        assert convert_text("@)@$") == "२०२४"
+
+    def test_long_text_matches_short_text(self):
+        """Texts above the memoization limit convert the same way."""
+        words = ["ljBfno"] * 100
+        assert convert_text(" ".join(words)) == " ".join(["विधालय"] * 100)
+        assert convert_text("") == ""
+
+
+class TestIsPreetiFont:
+    """Test cases for is_preeti_font."""
+
+    def test_font_names(self):
+        """Test case-insensitive Preeti font name detection."""
+        assert is_preeti_font("Preeti-Bold")
+        assert is_preeti_font("PCS NEPALI")
+        assert not is_preeti_font("Arial")
+        assert not is_preeti_font(None)
+        assert not is_preeti_font("")
@@ -0,0 +1,77 @@
+"""Tests for the custom exception hierarchy."""
+
+from preeti_unicode.core.exceptions import ConversionError, PreetiUnicodeError
+
+
+class TestToDict:
+    """Test cases for PreetiUnicodeError.to_dict."""
+
+    def test_dict_contents_and_reuse(self):
+        """The dictionary is built once and reused while nothing changes."""
+        cause = ValueError("bad byte")
+        error = ConversionError("failed", details={"line": 3}, cause=cause)
+
+        result = error.to_dict()
+
+        assert result == {
+            "error_code": "ConversionError",
+            "message": "failed",
+            "details": {"line": 3},
+            "type": "ConversionError",
+            "cause": "bad byte",
+        }
+        assert error.to_dict() is result
+
+    def test_reassigned_attributes_are_reflected(self):
+        """Reassigning message, error_code, details or cause rebuilds the dict."""
+        error = PreetiUnicodeError("first")
+        error.to_dict()
+
+        error.message = "second"
+        assert error.to_dict()["message"] == "second"
+
+        error.error_code = "E42"
+        assert error.to_dict()["error_code"] == "E42"
+
+        error.details = {"key": "value"}
+        assert error.to_dict()["details"] == {"key": "value"}
+
+        error.cause = KeyError("missing")
+        assert error.to_dict()["cause"] == "'missing'"
+
+        error.cause = None
+        assert error.to_dict()["cause"] is None
+
+    def test_detail_mutation_is_reflected(self):
+        """The cached dict shares the details mapping."""
+        error = PreetiUnicodeError("failed")
+        error.to_dict()
+
+        error.details["retry"] = True
+
+        assert error.to_dict()["details"] == {"retry": True}
+
+
+class TestConversionError:
+    """Test cases for ConversionError."""
+
+    def test_long_input_is_kept_and_previewed(self):
+        """The full input is kept while details get a 100 character preview."""
+        text = "k" * 150
+        error = ConversionError("failed", input_text=text, conversion_type="unicode")
+
+        assert error.input_text == text
+        assert error.input_text_preview == "k" * 100 + "..."
+        assert error.details == {
+            "input_text": "k" * 100 + "...",
+            "conversion_type": "unicode",
+        }
+
+    def test_short_or_missing_input(self):
+        """Short inputs are previewed unchanged and None adds no detail."""
+        assert ConversionError("failed", input_text="abc").details == {"input_text": "abc"}
+
+        error = ConversionError("failed")
+        assert error.input_text_preview is None
+        assert error.details == {}
+        assert str(error) == "ConversionError: failed"
@@ -0,0 +1,60 @@
+"""Tests for the component registry and factories."""
+
+import pytest
+
+from preeti_unicode.core import factories
+from preeti_unicode.core.exceptions import ConfigurationError
+
+
+class _UpperConverter:
+    """Minimal converter used to exercise registration."""
+
+    def __init__(self, suffix=""):
+        self.suffix = suffix
+
+
+class TestGlobalFactories:
+    """Test cases for the lazily created global factory instances."""
+
+    @pytest.mark.parametrize("name, factory_class", [
+        ("reader_factory", factories.ReaderFactory),
+        ("writer_factory", factories.WriterFactory),
+        ("converter_factory", factories.ConverterFactory),
+        ("validator_factory", factories.ValidatorFactory),
+    ])
+    def test_created_on_first_access(self, monkeypatch, name, factory_class):
+        """Each factory is created on first access and then reused."""
+        monkeypatch.delitem(vars(factories), name, raising=False)
+
+        factory = getattr(factories, name)
+
+        assert type(factory) is factory_class
+        assert vars(factories)[name] is factory
+        assert getattr(factories, name) is factory
+
+    def test_unknown_attribute(self):
+        """Other missing attributes still raise AttributeError."""
+        with pytest.raises(AttributeError):
+            factories.missing_factory
+
+
+class TestRegistration:
+    """Test cases for registering and creating components."""
+
+    def test_create_by_name_and_alias(self, monkeypatch):
+        """Registered components are created by name or alias."""
+        registry = factories.ComponentRegistry()
+        monkeypatch.setattr(factories, "_registry", registry)
+        registry.register_converter("upper", _UpperConverter, aliases=["up"])
+        factory = factories.ConverterFactory()
+
+        assert factory.create_converter("upper").suffix == ""
+        assert factory.create_converter("up", suffix="!").suffix == "!"
+        assert factory.list_available_converters() == ["upper"]
+
+    def test_unknown_component(self):
+        """Unknown names and component types raise ConfigurationError."""
+        with pytest.raises(ConfigurationError):
+            factories.ConverterFactory().create_converter("no-such-converter")
+        with pytest.raises(ConfigurationError):
+            factories.register_component("widget", "w", _UpperConverter)
@@ -0,0 +1,166 @@
+"""Tests for the structured logging system."""
+
+import json
+import logging
+import queue
+import time
+
+from preeti_unicode.core.config import LoggingConfig
+from preeti_unicode.enhanced.logging_system import (
+    AsyncStructuredLogger,
+    BytesRotatingFileHandler,
+    LoggingManager,
+    StructuredFormatter,
+    _NonBlockingQueueHandler,
+)
+
+
+def _file_config(tmp_path, **kwargs):
+    """Logging config that writes only to a file under tmp_path."""
+    return LoggingConfig(file_path=tmp_path / "app.log", console_output=False, **kwargs)
+
+
+def _read_entries(config):
+    """Read the JSON entries written to the config's log file."""
+    lines = config.file_path.read_text(encoding="utf-8").splitlines()
+    return [json.loads(line) for line in lines]
+
+
+def _record(message, level=logging.INFO):
+    """Build a log record without going through a logger."""
+    return logging.LogRecord("t", level, __file__, 1, message, None, None)
+
+
+class TestBytesRotatingFileHandler:
+    """Test cases for BytesRotatingFileHandler."""
+
+    def test_writes_structured_records_as_utf8(self, tmp_path):
+        """Structured records are written as one UTF-8 JSON line each."""
+        path = tmp_path / "app.log"
+        handler = BytesRotatingFileHandler(path, encoding="utf-8")
+        handler.setFormatter(StructuredFormatter())
+
+        handler.emit(_record("नमस्कार"))
+        handler.emit(_record("second"))
+        handler.close()
+
+        lines = path.read_text(encoding="utf-8").splitlines()
+        assert [json.loads(line)["message"] for line in lines] == ["नमस्कार", "second"]
+
+    def test_plain_formatter_and_rollover(self, tmp_path):
+        """Other formatters are encoded, and files roll over at maxBytes."""
+        path = tmp_path / "app.log"
+        handler = BytesRotatingFileHandler(path, maxBytes=64, backupCount=1, encoding="utf-8")
+        handler.setFormatter(logging.Formatter("%(levelname)s %(message)s"))
+
+        for i in range(10):
+            handler.emit(_record(f"message {i}"))
+        handler.close()
+
+        assert path.read_text(encoding="utf-8").endswith("INFO message 9\n")
+        assert path.stat().st_size < 64
+        assert (tmp_path / "app.log.1").exists()
+
+
+class TestFlushInterval:
+    """Test cases for interval-based flushing of the file handler."""
+
+    def test_buffers_until_error_or_close(self, tmp_path):
+        """Records stay buffered; errors flush at once and close flushes the rest."""
+        path = tmp_path / "app.log"
+        handler = BytesRotatingFileHandler(path, encoding="utf-8", flush_interval=60)
+        handler.setFormatter(StructuredFormatter())
+
+        handler.emit(_record("buffered"))
+        assert path.stat().st_size == 0
+
+        handler.emit(_record("failure", logging.ERROR))
+        assert len(path.read_text(encoding="utf-8").splitlines()) == 2
+
+        handler.emit(_record("pending"))
+        handler.close()
+        assert len(path.read_text(encoding="utf-8").splitlines()) == 3
+
+    def test_background_flush(self, tmp_path):
+        """The flusher thread writes buffered records every interval."""
+        path = tmp_path / "app.log"
+        handler = BytesRotatingFileHandler(path, encoding="utf-8", flush_interval=0.01)
+        handler.setFormatter(StructuredFormatter())
+
+        handler.emit(_record("buffered"))
+        deadline = time.monotonic() + 5
+        while path.stat().st_size == 0 and time.monotonic() < deadline:
+            time.sleep(0.01)
+
+        assert path.stat().st_size > 0
+        handler.close()
+
+    def test_logger_config(self, tmp_path):
+        """LoggingConfig.flush_interval reaches the logger's file handler."""
+        config = _file_config(tmp_path, flush_interval=0.5)
+        logger = AsyncStructuredLogger("test.flush.config", config)
+
+        file_handler, = logger._listener.handlers
+        assert file_handler.flush_interval == 0.5
+        logger.close()
+
+
+class TestNonBlockingQueueHandler:
+    """Test cases for the async logger's queue handler."""
+
+    def test_message_merged_before_enqueue(self):
+        """Mutating args after logging does not change the message."""
+        record_queue = queue.Queue()
+        handler = _NonBlockingQueueHandler(record_queue)
+        items = ["a"]
+        record = logging.LogRecord("t", logging.INFO, __file__, 1, "items=%s", (items,), None)
+
+        handler.emit(record)
+        items.append("b")
+
+        queued = record_queue.get_nowait()
+        assert queued.getMessage() == "items=['a']"
+        assert queued.args is None
+        assert "message" not in queued.__dict__
+        assert record.args == (items,)
+
+    def test_drops_records_when_full(self):
+        """A full queue drops new records instead of blocking."""
+        handler = _NonBlockingQueueHandler(queue.Queue(1))
+        record = logging.LogRecord("t", logging.INFO, __file__, 1, "msg", None, None)
+
+        handler.emit(record)
+        handler.emit(record)
+
+        assert handler.dropped == 1
+
+
+class TestAsyncStructuredLogger:
+    """Test cases for AsyncStructuredLogger."""
+
+    def test_close_flushes_and_is_idempotent(self, tmp_path):
+        """close() writes pending records and can be called again."""
+        config = _file_config(tmp_path)
+        logger = AsyncStructuredLogger("test.async.close", config)
+
+        logger.info("hello", user="u1")
+        logger.close()
+        logger.close()
+
+        entries = _read_entries(config)
+        assert [e["message"] for e in entries] == ["hello"]
+        assert entries[0]["extra_data"]["user"] == "u1"
+
+    def test_reconfigure_keeps_queue_size(self, tmp_path):
+        """LoggingManager rebuilds async loggers with their queue size."""
+        manager = LoggingManager()
+        logger = AsyncStructuredLogger("test.async.queue", _file_config(tmp_path), queue_size=7)
+        manager._loggers[logger.name] = logger
+
+        manager.configure_all_loggers(_file_config(tmp_path, backup_count=1))
+
+        rebuilt = manager._loggers[logger.name]
+        assert isinstance(rebuilt, AsyncStructuredLogger)
+        assert rebuilt.queue_size == 7
+        assert rebuilt.config.backup_count == 1
+        manager.shutdown()
@@ -0,0 +1,268 @@
+"""Tests for the parallel processing utilities."""
+
+import logging
+import os
+import time
+
+import pytest
+
+from preeti_unicode.enhanced import parallel_processor
+from preeti_unicode.enhanced.parallel_processor import (
+    BatchProcessor,
+    ParallelProcessor,
+    TaskResult,
+    TaskStatus,
+)
+
+
+def _record_chunks(processor):
+    """Wrap processor._process_all to record the size of each chunk."""
+    sizes = []
+    process_all = processor._process_all
+
+    def wrapper(tasks, task_ids, processor_func):
+        sizes.append(len(tasks))
+        return process_all(tasks, task_ids, processor_func)
+
+    processor._process_all = wrapper
+    return sizes
+
+
+def _slow_square(x):
+    time.sleep(0.03)
+    return x * x
+
+
+def _square(x):
+    return x * x
+
+
+def _reciprocal(x):
+    return 1 / x
+
+
+def _copy_upper(input_path, output_path):
+    if input_path.stem == "bad":
+        raise ValueError("unreadable")
+    output_path.write_text(input_path.read_text().upper())
+    return True
+
+
+def _affinity(_):
+    return frozenset(os.sched_getaffinity(0))
+
+
+class _RecordingTracker:
+    """Progress tracker that records the reported counts."""
+
+    def __init__(self):
+        self.updates = []
+        self.finished = False
+
+    def start(self, total, description=""):
+        self.total = total
+
+    def update(self, current, message=""):
+        self.updates.append(current)
+
+    def finish(self, message=""):
+        self.finished = True
+
+
+class TestMapMode:
+    """Test cases for the executor.map submit mode."""
+
+    def test_results_match_submit_mode(self):
+        """Map mode returns the same results, keyed by task ID."""
+        tasks = list(range(50))
+        submitted = ParallelProcessor(max_workers=2, nogil_worker=True).process_batch(tasks, _square)
+        mapped = ParallelProcessor(
+            max_workers=2, nogil_worker=True, submit_mode="map"
+        ).process_batch(tasks, _square)
+
+        assert mapped.keys() == submitted.keys()
+        assert all(mapped[k].output_data == submitted[k].output_data for k in mapped)
+
+    def test_failures_and_progress(self):
+        """Failed tasks are reported per task and progress counts every task."""
+        tracker = _RecordingTracker()
+        processor = ParallelProcessor(
+            max_workers=2, nogil_worker=True, submit_mode="map", progress_tracker=tracker
+        )
+
+        results = processor.process_batch([1, 0, 2], _reciprocal, task_id_func=str)
+
+        assert results["0"].status is TaskStatus.FAILED
+        assert isinstance(results["0"].error, ZeroDivisionError)
+        assert results["2"].output_data == 0.5
+        assert tracker.updates == [1, 2, 3]
+        assert tracker.finished
+
+    def test_process_pool(self):
+        """Map mode works with process pools."""
+        processor = ParallelProcessor(max_workers=2, use_processes=True, submit_mode="map")
+
+        results = processor.process_batch(list(range(10)), _square)
+
+        assert sorted(r.output_data for r in results.values()) == [x * x for x in range(10)]
+
+    def test_unknown_mode(self):
+        """Unsupported submit modes are rejected."""
+        with pytest.raises(ValueError):
+            ParallelProcessor(submit_mode="scatter")
+
+
+class TestAdaptiveChunks:
+    """Test cases for adaptive chunk sizing in process_batch."""
+
+    def test_slow_tasks_keep_requested_chunk_size(self):
+        """Chunks never shrink below the requested size."""
+        processor = ParallelProcessor(max_workers=2, nogil_worker=True)
+        sizes = _record_chunks(processor)
+
+        results = processor.process_batch(list(range(20)), _slow_square, chunk_size=5)
+
+        assert sizes == [5, 5, 5, 5]
+        assert sorted(r.output_data for r in results.values()) == [x * x for x in range(20)]
+
+    def test_fast_tasks_grow_to_four_times_requested_size(self):
+        """Chunks grow at most to four times the requested size."""
+        processor = ParallelProcessor(max_workers=2, nogil_worker=True)
+        sizes = _record_chunks(processor)
+
+        results = processor.process_batch(list(range(100)), _square, chunk_size=5)
+
+        assert sizes == [5, 20, 20, 20, 20, 15]
+        assert len(results) == 100
+        assert all(r.success for r in results.values())
+
+
+class TestGilNote:
+    """Test cases for the thread worker GIL note."""
+
+    def test_logged_once_per_process_at_debug(self, caplog, monkeypatch):
+        """Only the first thread processor logs the note, at debug level."""
+        monkeypatch.setattr(parallel_processor, "_gil_note_logged", False)
+        monkeypatch.setattr(parallel_processor, "_gil_enabled", lambda: True)
+        caplog.set_level(logging.DEBUG)
+
+        ParallelProcessor(max_workers=2)
+        ParallelProcessor(max_workers=2)
+
+        notes = [r for r in caplog.records if "GIL" in r.getMessage()]
+        assert len(notes) == 1
+        assert notes[0].levelno == logging.DEBUG
+
+    def test_not_logged_for_nogil_workers(self, caplog, monkeypatch):
+        """Processors whose tasks release the GIL skip the note."""
+        monkeypatch.setattr(parallel_processor, "_gil_note_logged", False)
+        monkeypatch.setattr(parallel_processor, "_gil_enabled", lambda: True)
+        caplog.set_level(logging.DEBUG)
+
+        ParallelProcessor(max_workers=2, nogil_worker=True)
+
+        assert not [r for r in caplog.records if "GIL" in r.getMessage()]
+
+
+class TestMaxWorkers:
+    """Test cases for max_workers handling."""
+
+    def test_defaults_to_available_cpus(self, monkeypatch):
+        """None resolves to the CPUs available to this process."""
+        monkeypatch.setattr(parallel_processor, "_available_cpus", lambda: 3)
+
+        assert ParallelProcessor().max_workers == 3
+        assert BatchProcessor().max_workers == 3
+        assert ParallelProcessor(max_workers=1).max_workers == 1
+
+    @pytest.mark.parametrize("max_workers", [0, -1])
+    def test_rejects_values_below_one(self, max_workers):
+        """Zero or negative worker counts are errors, not the CPU count."""
+        with pytest.raises(ValueError):
+            ParallelProcessor(max_workers=max_workers)
+        with pytest.raises(ValueError):
+            BatchProcessor(max_workers=max_workers)
+
+
+class TestProcessPool:
+    """Test cases for process pools in the default submit mode."""
+
+    def test_results_and_failures(self):
+        """Tasks run in worker processes and failures come back per task."""
+        processor = ParallelProcessor(max_workers=2, use_processes=True)
+
+        results = processor.process_batch([1, 0, 4], _reciprocal, task_id_func=str)
+
+        assert results["1"].output_data == 1.0
+        assert results["4"].output_data == 0.25
+        assert isinstance(results["0"].error, ZeroDivisionError)
+
+
+class TestCpuAffinity:
+    """Test cases for pinning worker processes with cpu_affinity."""
+
+    @pytest.mark.skipif(not hasattr(os, "sched_setaffinity"), reason="Linux only")
+    def test_workers_pinned_to_listed_cpus(self):
+        """Each worker process runs on one CPU from cpu_affinity."""
+        cpu = min(os.sched_getaffinity(0))
+        processor = ParallelProcessor(max_workers=2, use_processes=True, cpu_affinity=[cpu])
+
+        results = processor.process_batch(list(range(4)), _affinity)
+
+        assert {r.output_data for r in results.values()} == {frozenset({cpu})}
+
+    def test_ignored_for_thread_pools(self, caplog):
+        """Thread pools cannot be pinned, so cpu_affinity is dropped."""
+        processor = ParallelProcessor(max_workers=1, cpu_affinity=[0])
+
+        assert processor.cpu_affinity is None
+        assert "cpu_affinity" in caplog.text
+
+    @pytest.mark.skipif(not hasattr(os, "sched_setaffinity"), reason="Linux only")
+    def test_rejects_unavailable_cpus(self):
+        """CPUs outside this process's affinity mask are an error."""
+        unavailable = max(os.sched_getaffinity(0)) + 1
+
+        with pytest.raises(ValueError):
+            ParallelProcessor(use_processes=True, cpu_affinity=[unavailable])
+
+
+class TestBatchProcessor:
+    """Test cases for BatchProcessor."""
+
+    def test_process_files(self, tmp_path):
+        """Each input is converted to output_dir with the new extension."""
+        inputs = []
+        for name in ("one", "two", "bad"):
+            path = tmp_path / f"{name}.in"
+            path.write_text(name)
+            inputs.append(path)
+        output_dir = tmp_path / "out"
+
+        results = BatchProcessor(max_workers=2).process_files(
+            inputs, output_dir, _copy_upper, output_extension=".md"
+        )
+
+        assert results == {str(inputs[0]): True, str(inputs[1]): True, str(inputs[2]): False}
+        assert (output_dir / "one.md").read_text() == "ONE"
+        assert (output_dir / "two.md").read_text() == "TWO"
+
+    def test_statistics(self):
+        """Statistics average the timed tasks only."""
+        results = {
+            "a": TaskResult("a", TaskStatus.COMPLETED, None, execution_time=1.0),
+            "b": TaskResult("b", TaskStatus.COMPLETED, None, execution_time=3.0),
+            "c": TaskResult("c", TaskStatus.FAILED, None),
+        }
+
+        stats = BatchProcessor(max_workers=1).get_statistics(results)
+
+        assert stats == {
+            "total_tasks": 3,
+            "successful_tasks": 2,
+            "failed_tasks": 1,
+            "success_rate": 2 / 3,
+            "average_execution_time": 2.0,
+            "total_execution_time": 4.0,
+        }
+        assert BatchProcessor(max_workers=1).get_statistics({})["success_rate"] == 0
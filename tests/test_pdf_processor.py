@@ -0,0 +1,181 @@
+"""Tests for the enhanced PDF reader."""
+
+from concurrent.futures import ProcessPoolExecutor
+
+import pytest
+
+fitz = pytest.importorskip("pymupdf")
+
+from preeti_unicode.enhanced import pdf_processor
+from preeti_unicode.enhanced.pdf_processor import EnhancedPDFReader
+
+
+PAGE_COUNT = 12
+
+
+@pytest.fixture
+def sample_pdf(tmp_path):
+    """A multi-page PDF with two fonts on every page."""
+    path = tmp_path / "sample.pdf"
+    doc = fitz.open()
+    for i in range(PAGE_COUNT):
+        page = doc.new_page()
+        page.insert_text((72, 72), f"Page {i + 1} heading", fontname="helv")
+        page.insert_text((72, 100), f"Body text {i + 1}", fontname="tiro")
+    doc.save(path)
+    doc.close()
+    return path
+
+
+def _read(path, **kwargs):
+    """Read a PDF without the integrity check."""
+    return EnhancedPDFReader().read(path, validate_integrity=False, **kwargs)
+
+
+def _signature(result):
+    """Comparable view of the extracted pages."""
+    return [
+        (p["page_number"], p["text"], p["blocks"], [(f["text"], f["font"]) for f in p["font_info"]])
+        for p in result["pages"]
+    ]
+
+
+class TestProcessWorkers:
+    """Test cases for extracting pages in worker processes."""
+
+    def test_matches_sequential_extraction(self, sample_pdf, monkeypatch):
+        """Worker processes return the same pages, in order, as one process."""
+        pools = []
+
+        class RecordingPool(ProcessPoolExecutor):
+            def __init__(self, *args, **kwargs):
+                pools.append(kwargs["max_workers"])
+                super().__init__(*args, **kwargs)
+
+        monkeypatch.setattr(pdf_processor, "ProcessPoolExecutor", RecordingPool)
+        monkeypatch.setattr(pdf_processor, "_get_max_workers", lambda total, cap: min(total, cap))
+
+        parallel = _read(sample_pdf, max_workers=2)
+        sequential = _read(sample_pdf, parallel_processing=False)
+
+        assert pools == [2]
+        assert _signature(parallel) == _signature(sequential)
+        assert parallel["pages"][0]["text"] == "Page 1 heading\n\nBody text 1"
+        assert parallel["metadata"]["page_count"] == PAGE_COUNT
+
+    def test_small_documents_use_threads(self, sample_pdf, monkeypatch):
+        """Documents with fewer than two pages per worker stay in-process."""
+        monkeypatch.setattr(pdf_processor, "ProcessPoolExecutor", None)
+        monkeypatch.setattr(pdf_processor, "_get_max_workers", lambda total, cap: min(total, cap))
+
+        result = _read(sample_pdf, max_workers=8)
+
+        assert [p["page_number"] for p in result["pages"]] == list(range(1, PAGE_COUNT + 1))
+
+    def test_worker_count_capped_by_available_cpus(self, monkeypatch):
+        """Page workers share the CPU count used by ParallelProcessor."""
+        monkeypatch.setattr(pdf_processor, "_available_cpus", lambda: 3)
+
+        assert pdf_processor._get_max_workers(12, 8) == 3
+        assert pdf_processor._get_max_workers(2, 8) == 2
+        assert pdf_processor._get_max_workers(12, 1) == 1
+
+
+class TestPageBlocks:
+    """Test cases for splitting pages into contiguous worker blocks."""
+
+    @pytest.mark.parametrize("total_pages, max_workers", [(30, 2), (12, 4), (5, 8), (1, 1)])
+    def test_blocks_cover_every_page_once(self, total_pages, max_workers):
+        """Blocks are contiguous, ordered and cover the whole document."""
+        blocks = pdf_processor._page_blocks(total_pages, max_workers)
+
+        assert blocks[0][0] == 0
+        assert blocks[-1][1] == total_pages
+        assert all(end == next_start for (_, end), (next_start, _) in zip(blocks, blocks[1:]))
+        assert len(blocks) <= max_workers * pdf_processor._BLOCKS_PER_WORKER
+
+    def test_page_errors_stay_per_page(self, sample_pdf, monkeypatch):
+        """A failing page gets placeholder content without losing its block."""
+        extract = pdf_processor._extract_page_content
+
+        def flaky_extract(doc, page_num, need_font_info=True):
+            if page_num == 3:
+                raise RuntimeError("damaged page")
+            return extract(doc, page_num, need_font_info)
+
+        monkeypatch.setattr(pdf_processor, "_extract_page_content", flaky_extract)
+        monkeypatch.setattr(pdf_processor, "_get_max_workers", lambda total, cap: min(total, cap))
+
+        pages = _read(sample_pdf, max_workers=8)["pages"]
+
+        assert pages[3]["error"] == "damaged page"
+        assert pages[3]["text"] == ""
+        assert pages[2]["text"].startswith("Page 3")
+        assert pages[4]["text"].startswith("Page 5")
+
+    def test_progress_reports_completed_page_count(self, sample_pdf, monkeypatch):
+        """Progress messages count finished pages, whatever order blocks finish in."""
+        updates = []
+
+        class Tracker:
+            def start(self, total, description=""):
+                pass
+
+            def update(self, current, message=""):
+                updates.append((current, message))
+
+            def finish(self, message=""):
+                pass
+
+        monkeypatch.setattr(pdf_processor, "_get_max_workers", lambda total, cap: min(total, cap))
+        reader = EnhancedPDFReader(progress_tracker=Tracker())
+
+        reader.read(sample_pdf, validate_integrity=False, max_workers=8)
+
+        assert updates[-1] == (PAGE_COUNT, f"Processed {PAGE_COUNT}/{PAGE_COUNT} pages")
+        assert all(message == f"Processed {n}/{PAGE_COUNT} pages" for n, message in updates)
+
+
+class TestNeedFontInfo:
+    """Test cases for skipping per-span font extraction."""
+
+    @pytest.mark.parametrize("parallel_processing", [False, True])
+    def test_text_without_font_info(self, sample_pdf, parallel_processing):
+        """need_font_info=False keeps the page text but drops span details."""
+        full = _read(sample_pdf, parallel_processing=parallel_processing)
+        fast = _read(sample_pdf, parallel_processing=parallel_processing, need_font_info=False)
+
+        for full_page, fast_page in zip(full["pages"], fast["pages"]):
+            assert fast_page["font_info"] == []
+            assert full_page["font_info"]
+            assert fast_page["text"].split() == full_page["text"].split()
+            assert fast_page["page_number"] == full_page["page_number"]
+
+
+class TestFontDetection:
+    """Test cases for memoized Preeti font detection."""
+
+    def test_each_font_checked_once_per_page(self, sample_pdf, monkeypatch):
+        """Repeated spans in one font reuse the page's detection result."""
+        checked = []
+
+        def is_preeti(font):
+            checked.append(font)
+            return font.startswith("Times")
+
+        monkeypatch.setattr(pdf_processor, "_is_preeti_font_cached", is_preeti)
+        doc = fitz.open(sample_pdf)
+        page = doc.load_page(0)
+        page.insert_text((72, 130), "More body text", fontname="tiro")
+
+        content = pdf_processor._extract_page_content(doc, 0)
+        doc.close()
+
+        assert sorted(checked) == sorted(set(checked))
+        assert len(checked) == 2
+        assert [f["is_preeti"] for f in content["font_info"]] == [False, True, True]
+
+    def test_cached_detection_matches_converter(self):
+        """The module-level cache answers like is_preeti_font."""
+        for font in ("Preeti", "PCS NEPALI", "Helvetica", ""):
+            assert pdf_processor._is_preeti_font_cached(font) == pdf_processor.is_preeti_font(font)